@@ -11,7 +11,6 @@ except ImportError as e:
         "pyyaml missing/installed without libyaml bindings. See oresat-configs README.md for more"
     ) from e
 
-from dataclasses import dataclass
 from importlib.resources import as_file
 from typing import Union
 
@@ -1,13 +1,32 @@
 """Convert OreSat configs to ODs."""
 
 from collections import namedtuple
-from copy import deepcopy
+from dataclasses import replace
+from functools import cache
 from importlib import abc, resources
-from typing import Union
+from typing import Any, Optional, Union
 
-import canopen
 from canopen import ObjectDictionary
-from canopen.objectdictionary import Array, Record, Variable
+from canopen.objectdictionary import (
+    BOOLEAN,
+    DOMAIN,
+    INTEGER8,
+    INTEGER16,
+    INTEGER32,
+    INTEGER64,
+    INTEGER_TYPES,
+    OCTET_STRING,
+    REAL32,
+    REAL64,
+    UNSIGNED8,
+    UNSIGNED16,
+    UNSIGNED32,
+    UNSIGNED64,
+    VISIBLE_STRING,
+    Array,
+    Record,
+    Variable,
+)
 from dacite import from_dict
 from yaml import CLoader, load
 
@@ -25,69 +44,73 @@ TPDO_COMM_START = 0x1800
 TPDO_PARA_START = 0x1A00
 
 STR_2_OD_DATA_TYPE = {
-    "bool": canopen.objectdictionary.BOOLEAN,
-    "int8": canopen.objectdictionary.INTEGER8,
-    "int16": canopen.objectdictionary.INTEGER16,
-    "int32": canopen.objectdictionary.INTEGER32,
-    "int64": canopen.objectdictionary.INTEGER64,
-    "uint8": canopen.objectdictionary.UNSIGNED8,
-    "uint16": canopen.objectdictionary.UNSIGNED16,
-    "uint32": canopen.objectdictionary.UNSIGNED32,
-    "uint64": canopen.objectdictionary.UNSIGNED64,
-    "float32": canopen.objectdictionary.REAL32,
-    "float64": canopen.objectdictionary.REAL64,
-    "str": canopen.objectdictionary.VISIBLE_STRING,
-    "octet_str": canopen.objectdictionary.OCTET_STRING,
-    "domain": canopen.objectdictionary.DOMAIN,
+    "bool": BOOLEAN,
+    "int8": INTEGER8,
+    "int16": INTEGER16,
+    "int32": INTEGER32,
+    "int64": INTEGER64,
+    "uint8": UNSIGNED8,
+    "uint16": UNSIGNED16,
+    "uint32": UNSIGNED32,
+    "uint64": UNSIGNED64,
+    "float32": REAL32,
+    "float64": REAL64,
+    "str": VISIBLE_STRING,
+    "octet_str": OCTET_STRING,
+    "domain": DOMAIN,
 }
 
 OdDataTypeInfo = namedtuple("OdDataTypeInfo", ("default", "size", "low_limit", "high_limit"))
 
 OD_DATA_TYPES = {
-    canopen.objectdictionary.BOOLEAN: OdDataTypeInfo(False, 8, None, None),
-    canopen.objectdictionary.INTEGER8: OdDataTypeInfo(0, 8, -(2**8) // 2, 2**8 // 2 - 1),
-    canopen.objectdictionary.INTEGER16: OdDataTypeInfo(0, 16, -(2**16) // 2, 2**16 // 2 - 1),
-    canopen.objectdictionary.INTEGER32: OdDataTypeInfo(0, 16, -(2**32) // 2, 2**32 // 2 - 1),
-    canopen.objectdictionary.INTEGER64: OdDataTypeInfo(0, 16, -(2**64) // 2, 2**64 // 2 - 1),
-    canopen.objectdictionary.UNSIGNED8: OdDataTypeInfo(0, 8, 0, 2**8 - 1),
-    canopen.objectdictionary.UNSIGNED16: OdDataTypeInfo(0, 16, 0, 2**16 - 1),
-    canopen.objectdictionary.UNSIGNED32: OdDataTypeInfo(0, 32, 0, 2**32 - 1),
-    canopen.objectdictionary.UNSIGNED64: OdDataTypeInfo(0, 64, 0, 2**64 - 1),
-    canopen.objectdictionary.REAL32: OdDataTypeInfo(0.0, 32, None, None),
-    canopen.objectdictionary.REAL64: OdDataTypeInfo(0.0, 64, None, None),
-    canopen.objectdictionary.VISIBLE_STRING: OdDataTypeInfo("", 0, None, None),
-    canopen.objectdictionary.OCTET_STRING: OdDataTypeInfo(b"", 0, None, None),
-    canopen.objectdictionary.DOMAIN: OdDataTypeInfo(None, 0, None, None),
+    BOOLEAN: OdDataTypeInfo(False, 8, None, None),
+    INTEGER8: OdDataTypeInfo(0, 8, -(2**8) // 2, 2**8 // 2 - 1),
+    INTEGER16: OdDataTypeInfo(0, 16, -(2**16) // 2, 2**16 // 2 - 1),
+    INTEGER32: OdDataTypeInfo(0, 16, -(2**32) // 2, 2**32 // 2 - 1),
+    INTEGER64: OdDataTypeInfo(0, 16, -(2**64) // 2, 2**64 // 2 - 1),
+    UNSIGNED8: OdDataTypeInfo(0, 8, 0, 2**8 - 1),
+    UNSIGNED16: OdDataTypeInfo(0, 16, 0, 2**16 - 1),
+    UNSIGNED32: OdDataTypeInfo(0, 32, 0, 2**32 - 1),
+    UNSIGNED64: OdDataTypeInfo(0, 64, 0, 2**64 - 1),
+    REAL32: OdDataTypeInfo(0.0, 32, None, None),
+    REAL64: OdDataTypeInfo(0.0, 64, None, None),
+    VISIBLE_STRING: OdDataTypeInfo("", 0, None, None),
+    OCTET_STRING: OdDataTypeInfo(b"", 0, None, None),
+    DOMAIN: OdDataTypeInfo(None, 0, None, None),
 }
 
-DYNAMIC_LEN_DATA_TYPES = [
-    canopen.objectdictionary.VISIBLE_STRING,
-    canopen.objectdictionary.OCTET_STRING,
-    canopen.objectdictionary.DOMAIN,
-]
+DYNAMIC_LEN_DATA_TYPES = frozenset(
+    (
+        VISIBLE_STRING,
+        OCTET_STRING,
+        DOMAIN,
+    )
+)
+
+_INTEGER_TYPES = frozenset(INTEGER_TYPES)
 
 
-def _set_var_default(obj: ConfigObject, var: Variable) -> None:
-    """Set the variables default value based off of configs."""
+def _var_default(obj: ConfigObject, data_type: int) -> Any:
+    """Get a variable's default value based off of configs."""
 
     default = obj.default
     if obj.data_type == "octet_str":
         default = b"\x00" * obj.length
     elif default is None:
-        default = OD_DATA_TYPES[var.data_type].default
-    elif var.data_type in canopen.objectdictionary.INTEGER_TYPES and isinstance(default, str):
+        default = OD_DATA_TYPES[data_type].default
+    elif data_type in _INTEGER_TYPES and isinstance(default, str):
         # remove node id
         if "+$NODE_ID" in default:
             default = default.split("+")[0]
         elif "$NODE_ID+" in default:
-            default = var.default.split("+")[1]
+            default = default.split("+")[1]
 
         # convert str to int
         if default.startswith("0x"):
             default = int(default, 16)
         else:
             default = int(default)
-    var.default = default
+    return default
 
 
 def _parse_bit_definitions(obj: Union[IndexObject, SubindexObject]) -> dict[str, list[int]]:
@@ -104,17 +127,16 @@ def _parse_bit_definitions(obj: Union[IndexObject, SubindexObject]) -> dict[str,
 
 
 def _make_var(obj: Union[IndexObject, SubindexObject], index: int, subindex: int = 0) -> Variable:
-    var = canopen.objectdictionary.Variable(obj.name, index, subindex)
+    var = Variable(obj.name, index, subindex)
     var.access_type = obj.access_type
     var.description = obj.description
     var.bit_definitions = _parse_bit_definitions(obj)
-    for name, value in obj.value_descriptions.items():
-        var.add_value_description(value, name)
+    var.value_descriptions = {value: name for name, value in obj.value_descriptions.items()}
     var.unit = obj.unit
     if obj.scale_factor != 1:
         var.factor = obj.scale_factor
     var.data_type = STR_2_OD_DATA_TYPE[obj.data_type]
-    _set_var_default(obj, var)
+    var.default = _var_default(obj, var.data_type)
     if var.data_type not in DYNAMIC_LEN_DATA_TYPES:
         var.pdo_mappable = True
     if obj.value_descriptions:
@@ -128,11 +150,11 @@ def _make_var(obj: Union[IndexObject, SubindexObject], index: int, subindex: int
 
 def _make_rec(obj: IndexObject) -> Record:
     index = obj.index
-    rec = canopen.objectdictionary.Record(obj.name, index)
+    rec = Record(obj.name, index)
 
-    var0 = canopen.objectdictionary.Variable("highest_index_supported", index, 0x0)
+    var0 = Variable("highest_index_supported", index, 0x0)
     var0.access_type = "const"
-    var0.data_type = canopen.objectdictionary.UNSIGNED8
+    var0.data_type = UNSIGNED8
     rec.add_member(var0)
 
     for sub_obj in obj.subindexes:
@@ -147,11 +169,11 @@ def _make_rec(obj: IndexObject) -> Record:
 
 def _make_arr(obj: IndexObject, node_ids: dict[str, int]) -> Array:
     index = obj.index
-    arr = canopen.objectdictionary.Array(obj.name, index)
+    arr = Array(obj.name, index)
 
-    var0 = canopen.objectdictionary.Variable("highest_index_supported", index, 0x0)
+    var0 = Variable("highest_index_supported", index, 0x0)
     var0.access_type = "const"
-    var0.data_type = canopen.objectdictionary.UNSIGNED8
+    var0.data_type = UNSIGNED8
     arr.add_member(var0)
 
     subindexes = []
@@ -168,26 +190,34 @@ def _make_arr(obj: IndexObject, node_ids: dict[str, int]) -> Array:
                 names.append(name)
                 subindexes.append(sub)
 
+        data_type = STR_2_OD_DATA_TYPE[gen_sub.data_type]
+        default = _var_default(gen_sub, data_type)
+        pdo_mappable = data_type not in DYNAMIC_LEN_DATA_TYPES
+        bit_defs = _parse_bit_definitions(gen_sub)
+        value_descs = {value: name for name, value in gen_sub.value_descriptions.items()}
+        high_limit: Optional[int]
+        low_limit: Optional[int]
+        if gen_sub.value_descriptions:
+            high_limit = gen_sub.high_limit or max(gen_sub.value_descriptions.values())
+            low_limit = gen_sub.low_limit or min(gen_sub.value_descriptions.values())
+        else:
+            high_limit = gen_sub.high_limit
+            low_limit = gen_sub.low_limit
+
         for subindex, name in zip(subindexes, names):
             if subindex in arr.subindices:
                 raise ValueError(f"subindex 0x{subindex:X} already in array")
-            var = canopen.objectdictionary.Variable(name, index, subindex)
+            var = Variable(name, index, subindex)
             var.access_type = gen_sub.access_type
-            var.data_type = STR_2_OD_DATA_TYPE[gen_sub.data_type]
-            var.bit_definitions = _parse_bit_definitions(gen_sub)
-            for name, value in gen_sub.value_descriptions.items():
-                var.add_value_description(value, name)
+            var.data_type = data_type
+            var.bit_definitions = {bit_name: list(bits) for bit_name, bits in bit_defs.items()}
+            var.value_descriptions = dict(value_descs)
             var.unit = gen_sub.unit
             var.factor = gen_sub.scale_factor
-            if obj.value_descriptions:
-                var.max = gen_sub.high_limit or max(gen_sub.value_descriptions.values())
-                var.min = gen_sub.low_limit or min(gen_sub.value_descriptions.values())
-            else:
-                var.max = gen_sub.high_limit
-                var.min = gen_sub.low_limit
-            _set_var_default(gen_sub, var)
-            if var.data_type not in DYNAMIC_LEN_DATA_TYPES:
-                var.pdo_mappable = True
+            var.max = high_limit
+            var.min = low_limit
+            var.default = default
+            var.pdo_mappable = pdo_mappable
             arr.add_member(var)
             var0.default = subindex
     else:
@@ -201,6 +231,18 @@ def _make_arr(obj: IndexObject, node_ids: dict[str, int]) -> Array:
     return arr
 
 
+def _make_obj(obj: IndexObject, node_ids: dict[str, int]) -> Union[Variable, Record, Array]:
+    """Make a new canopen object from an index object config."""
+
+    if obj.object_type == "variable":
+        return _make_var(obj, obj.index)
+    if obj.object_type == "record":
+        return _make_rec(obj)
+    if obj.object_type == "array":
+        return _make_arr(obj, node_ids)
+    raise ValueError(f"invalid object_type {obj.object_type} for 0x{obj.index:X}")
+
+
 def _add_objects(
     od: ObjectDictionary, objects: list[IndexObject], node_ids: dict[str, int]
 ) -> None:
@@ -210,108 +252,78 @@ def _add_objects(
         if obj.index in od.indices:
             raise ValueError(f"index 0x{obj.index:X} already in OD")
 
-        if obj.object_type == "variable":
-            var = _make_var(obj, obj.index)
-            od.add_object(var)
-        elif obj.object_type == "record":
-            rec = _make_rec(obj)
-            od.add_object(rec)
-        elif obj.object_type == "array":
-            arr = _make_arr(obj, node_ids)
-            od.add_object(arr)
+        od.add_object(_make_obj(obj, node_ids))
 
 
 def _add_tpdo_data(od: ObjectDictionary, config: CardConfig) -> None:
     """Add tpdo objects to OD."""
 
-    tpdos = config.tpdos
+    dev_info = od.device_information
+    is_gps = dev_info.product_name == "gps"
 
-    for tpdo in tpdos:
-        od.device_information.nr_of_TXPDO += 1
+    for tpdo in config.tpdos:
+        dev_info.nr_of_TXPDO += 1
 
         comm_index = TPDO_COMM_START + tpdo.num - 1
         map_index = TPDO_PARA_START + tpdo.num - 1
-        comm_rec = canopen.objectdictionary.Record(
-            f"tpdo_{tpdo.num}_communication_parameters", comm_index
-        )
-        map_rec = canopen.objectdictionary.Record(f"tpdo_{tpdo.num}_mapping_parameters", map_index)
+        comm_rec = Record(f"tpdo_{tpdo.num}_communication_parameters", comm_index)
+        map_rec = Record(f"tpdo_{tpdo.num}_mapping_parameters", map_index)
         od.add_object(map_rec)
         od.add_object(comm_rec)
 
         # index 0 for mapping index
-        var0 = canopen.objectdictionary.Variable("highest_index_supported", map_index, 0x0)
+        var0 = Variable("highest_index_supported", map_index, 0x0)
         var0.access_type = "const"
-        var0.data_type = canopen.objectdictionary.UNSIGNED8
+        var0.data_type = UNSIGNED8
+        var0.default = len(tpdo.fields)
         map_rec.add_member(var0)
 
-        for t_field in tpdo.fields:
-            subindex = tpdo.fields.index(t_field) + 1
-            var = canopen.objectdictionary.Variable(
-                f"mapping_object_{subindex}", map_index, subindex
-            )
+        for subindex, t_field in enumerate(tpdo.fields, 1):
+            var = Variable(f"mapping_object_{subindex}", map_index, subindex)
             var.access_type = "const"
-            var.data_type = canopen.objectdictionary.UNSIGNED32
+            var.data_type = UNSIGNED32
             if len(t_field) == 1:
                 mapped_obj = od[t_field[0]]
             elif len(t_field) == 2:
                 mapped_obj = od[t_field[0]][t_field[1]]
             else:
                 raise ValueError("tpdo field must be a 1 or 2 values")
-            mapped_subindex = mapped_obj.subindex
-            value = mapped_obj.index << 16
-            value += mapped_subindex << 8
-            value += OD_DATA_TYPES[mapped_obj.data_type].size
-            var.default = value
+            var.default = (
+                (mapped_obj.index << 16)
+                | (mapped_obj.subindex << 8)
+                | OD_DATA_TYPES[mapped_obj.data_type].size
+            )
             map_rec.add_member(var)
 
-        var0.default = len(map_rec) - 1
-
-        # index 0 for comms index
-        var0 = canopen.objectdictionary.Variable("highest_index_supported", comm_index, 0x0)
-        var0.access_type = "const"
-        var0.data_type = canopen.objectdictionary.UNSIGNED8
-        var0.default = 0x6
-        comm_rec.add_member(var0)
-
-        var = canopen.objectdictionary.Variable("cob_id", comm_index, 0x1)
-        var.access_type = "const"
-        var.data_type = canopen.objectdictionary.UNSIGNED32
         node_id = od.node_id
-        if od.device_information.product_name == "gps" and tpdo.num == 16:
+        cob_id_num = tpdo.num
+        if is_gps and tpdo.num == 16:
             # time sync TPDO from GPS uses C3 TPDO 1
             node_id = 0x1
-            tpdo.num = 1
-        var.default = node_id + (((tpdo.num - 1) % 4) * 0x100) + ((tpdo.num - 1) // 4) + 0x180
+            cob_id_num = 1
+        cob_id = node_id + (((cob_id_num - 1) % 4) * 0x100) + ((cob_id_num - 1) // 4) + 0x180
         if tpdo.rtr:
-            var.default |= 1 << 30  # rtr bit, 1 for no RTR allowed
-        comm_rec.add_member(var)
+            cob_id |= 1 << 30  # rtr bit, 1 for no RTR allowed
 
-        var = canopen.objectdictionary.Variable("transmission_type", comm_index, 0x2)
-        var.access_type = "const"
-        var.data_type = canopen.objectdictionary.UNSIGNED8
         if tpdo.transmission_type == "sync":
-            var.default = tpdo.sync
+            transmission_type = tpdo.sync
         else:
-            var.default = 254  # event driven
-        comm_rec.add_member(var)
-
-        var = canopen.objectdictionary.Variable("inhibit_time", comm_index, 0x3)
-        var.access_type = "const"
-        var.data_type = canopen.objectdictionary.UNSIGNED16
-        var.default = tpdo.inhibit_time_ms
-        comm_rec.add_member(var)
-
-        var = canopen.objectdictionary.Variable("event_timer", comm_index, 0x5)
-        var.access_type = "rw"
-        var.data_type = canopen.objectdictionary.UNSIGNED16
-        var.default = tpdo.event_timer_ms
-        comm_rec.add_member(var)
-
-        var = canopen.objectdictionary.Variable("sync_start_value", comm_index, 0x6)
-        var.access_type = "const"
-        var.data_type = canopen.objectdictionary.UNSIGNED8
-        var.default = tpdo.sync_start_value
-        comm_rec.add_member(var)
+            transmission_type = 254  # event driven
+
+        comm_vars = (
+            ("highest_index_supported", 0x0, "const", UNSIGNED8, 0x6),
+            ("cob_id", 0x1, "const", UNSIGNED32, cob_id),
+            ("transmission_type", 0x2, "const", UNSIGNED8, transmission_type),
+            ("inhibit_time", 0x3, "const", UNSIGNED16, tpdo.inhibit_time_ms),
+            ("event_timer", 0x5, "rw", UNSIGNED16, tpdo.event_timer_ms),
+            ("sync_start_value", 0x6, "const", UNSIGNED8, tpdo.sync_start_value),
+        )
+        for var_name, subindex, access_type, data_type, default in comm_vars:
+            var = Variable(var_name, comm_index, subindex)
+            var.access_type = access_type
+            var.data_type = data_type
+            var.default = default
+            comm_rec.add_member(var)
 
 
 def _add_rpdo_data(
@@ -328,125 +340,121 @@ def _add_rpdo_data(
         rpdo_mapped_index = 0x2010
         rpdo_mapped_rec = rpdo_node_od[rpdo_mapped_index]
         rpdo_mapped_subindex = 0
+        rpdo_mapped_obj = rpdo_mapped_rec
     else:
         rpdo_mapped_index = 0x5000 + tpdo_node_od.node_id
         if rpdo_mapped_index not in rpdo_node_od:
-            rpdo_mapped_rec = canopen.objectdictionary.Record(tpdo_node_name, rpdo_mapped_index)
+            rpdo_mapped_rec = Record(tpdo_node_name, rpdo_mapped_index)
             rpdo_mapped_rec.description = f"{tpdo_node_name} tpdo mapped data"
             rpdo_node_od.add_object(rpdo_mapped_rec)
 
             # index 0 for node data index
-            var = canopen.objectdictionary.Variable(
-                "highest_index_supported", rpdo_mapped_index, 0x0
-            )
-            var.access_type = "const"
-            var.data_type = canopen.objectdictionary.UNSIGNED8
-            var.default = 0
-            rpdo_mapped_rec.add_member(var)
+            mapped_var0 = Variable("highest_index_supported", rpdo_mapped_index, 0x0)
+            mapped_var0.access_type = "const"
+            mapped_var0.data_type = UNSIGNED8
+            mapped_var0.default = 0
+            rpdo_mapped_rec.add_member(mapped_var0)
         else:
             rpdo_mapped_rec = rpdo_node_od[rpdo_mapped_index]
+            mapped_var0 = rpdo_mapped_rec[0]
 
-    rpdo_node_od.device_information.nr_of_RXPDO += 1
-    rpdo_num = rpdo_node_od.device_information.nr_of_RXPDO
+    dev_info = rpdo_node_od.device_information
+    dev_info.nr_of_RXPDO += 1
+    rpdo_num = dev_info.nr_of_RXPDO
 
     rpdo_comm_index = RPDO_COMM_START + rpdo_num - 1
-    rpdo_comm_rec = canopen.objectdictionary.Record(
-        f"rpdo_{rpdo_num}_communication_parameters", rpdo_comm_index
-    )
+    rpdo_comm_rec = Record(f"rpdo_{rpdo_num}_communication_parameters", rpdo_comm_index)
     rpdo_node_od.add_object(rpdo_comm_rec)
 
-    var = canopen.objectdictionary.Variable("cob_id", rpdo_comm_index, 0x1)
+    var = Variable("cob_id", rpdo_comm_index, 0x1)
     var.access_type = "const"
-    var.data_type = canopen.objectdictionary.UNSIGNED32
+    var.data_type = UNSIGNED32
     var.default = tpdo_node_od[tpdo_comm_index][0x1].default  # get value from TPDO def
     rpdo_comm_rec.add_member(var)
 
-    var = canopen.objectdictionary.Variable("transmission_type", rpdo_comm_index, 0x2)
+    var = Variable("transmission_type", rpdo_comm_index, 0x2)
     var.access_type = "const"
-    var.data_type = canopen.objectdictionary.UNSIGNED8
+    var.data_type = UNSIGNED8
     var.default = 254
     rpdo_comm_rec.add_member(var)
 
-    var = canopen.objectdictionary.Variable("event_timer", rpdo_comm_index, 0x5)
+    var = Variable("event_timer", rpdo_comm_index, 0x5)
     var.access_type = "const"
-    var.data_type = canopen.objectdictionary.UNSIGNED16
+    var.data_type = UNSIGNED16
     var.default = 0
     rpdo_comm_rec.add_member(var)
 
     # index 0 for comms index
-    var = canopen.objectdictionary.Variable("highest_index_supported", rpdo_comm_index, 0x0)
+    var = Variable("highest_index_supported", rpdo_comm_index, 0x0)
     var.access_type = "const"
-    var.data_type = canopen.objectdictionary.UNSIGNED8
-    var.default = sorted(list(rpdo_comm_rec.subindices))[-1]  # no subindex 3 or 4
+    var.data_type = UNSIGNED8
+    var.default = max(rpdo_comm_rec.subindices)  # no subindex 3 or 4
     rpdo_comm_rec.add_member(var)
 
     rpdo_mapping_index = RPDO_PARA_START + rpdo_num - 1
-    rpdo_mapping_rec = canopen.objectdictionary.Record(
-        f"rpdo_{rpdo_num}_mapping_parameters", rpdo_mapping_index
-    )
+    rpdo_mapping_rec = Record(f"rpdo_{rpdo_num}_mapping_parameters", rpdo_mapping_index)
     rpdo_node_od.add_object(rpdo_mapping_rec)
 
+    tpdo_mapping_rec = tpdo_node_od[tpdo_mapping_index]
+
     # index 0 for map index
-    var = canopen.objectdictionary.Variable("highest_index_supported", rpdo_mapping_index, 0x0)
+    var = Variable("highest_index_supported", rpdo_mapping_index, 0x0)
     var.access_type = "const"
-    var.data_type = canopen.objectdictionary.UNSIGNED8
-    var.default = 0
+    var.data_type = UNSIGNED8
+    var.default = len(tpdo_mapping_rec) - 1
     rpdo_mapping_rec.add_member(var)
 
-    for j in range(len(tpdo_node_od[tpdo_mapping_index])):
-        if j == 0:
-            continue  # skip
+    if not time_sync_tpdo:
+        rpdo_mapped_subindex = mapped_var0.default
 
-        tpdo_mapping_obj = tpdo_node_od[tpdo_mapping_index][j]
+    for rpdo_mapping_subindex in range(1, len(tpdo_mapping_rec)):
+        tpdo_mapping_obj = tpdo_mapping_rec[rpdo_mapping_subindex]
 
         # master node data
         if not time_sync_tpdo:
-            rpdo_mapped_subindex = rpdo_mapped_rec[0].default + 1
+            rpdo_mapped_subindex += 1
             tpdo_mapped_index = (tpdo_mapping_obj.default >> 16) & 0xFFFF
             tpdo_mapped_subindex = (tpdo_mapping_obj.default >> 8) & 0xFF
-            if isinstance(tpdo_node_od[tpdo_mapped_index], canopen.objectdictionary.Variable):
-                tpdo_mapped_obj = tpdo_node_od[tpdo_mapped_index]
+            tpdo_mapped = tpdo_node_od[tpdo_mapped_index]
+            if isinstance(tpdo_mapped, Variable):
+                tpdo_mapped_obj = tpdo_mapped
                 name = tpdo_mapped_obj.name
             else:
-                tpdo_mapped_obj = tpdo_node_od[tpdo_mapped_index][tpdo_mapped_subindex]
-                name = tpdo_node_od[tpdo_mapped_index].name + "_" + tpdo_mapped_obj.name
-            var = canopen.objectdictionary.Variable(name, rpdo_mapped_index, rpdo_mapped_subindex)
-            var.description = tpdo_mapped_obj.description
-            var.access_type = "rw"
-            var.data_type = tpdo_mapped_obj.data_type
-            var.default = tpdo_mapped_obj.default
-            var.unit = tpdo_mapped_obj.unit
-            var.factor = tpdo_mapped_obj.factor
-            var.bit_definitions = deepcopy(tpdo_mapped_obj.bit_definitions)
-            var.value_descriptions = deepcopy(tpdo_mapped_obj.value_descriptions)
-            var.max = tpdo_mapped_obj.max
-            var.min = tpdo_mapped_obj.min
-            var.pdo_mappable = True
-            rpdo_mapped_rec.add_member(var)
+                tpdo_mapped_obj = tpdo_mapped[tpdo_mapped_subindex]
+                name = tpdo_mapped.name + "_" + tpdo_mapped_obj.name
+            rpdo_mapped_obj = Variable(name, rpdo_mapped_index, rpdo_mapped_subindex)
+            rpdo_mapped_obj.description = tpdo_mapped_obj.description
+            rpdo_mapped_obj.access_type = "rw"
+            rpdo_mapped_obj.data_type = tpdo_mapped_obj.data_type
+            rpdo_mapped_obj.default = tpdo_mapped_obj.default
+            rpdo_mapped_obj.unit = tpdo_mapped_obj.unit
+            rpdo_mapped_obj.factor = tpdo_mapped_obj.factor
+            rpdo_mapped_obj.bit_definitions = {
+                bit_name: list(bits) for bit_name, bits in tpdo_mapped_obj.bit_definitions.items()
+            }
+            rpdo_mapped_obj.value_descriptions = dict(tpdo_mapped_obj.value_descriptions)
+            rpdo_mapped_obj.max = tpdo_mapped_obj.max
+            rpdo_mapped_obj.min = tpdo_mapped_obj.min
+            rpdo_mapped_obj.pdo_mappable = True
+            rpdo_mapped_rec.add_member(rpdo_mapped_obj)
 
         # master node mapping obj
-        rpdo_mapping_subindex = rpdo_mapping_rec[0].default + 1
-        var = canopen.objectdictionary.Variable(
+        var = Variable(
             f"mapping_object_{rpdo_mapping_subindex}",
             rpdo_mapping_index,
             rpdo_mapping_subindex,
         )
         var.access_type = "const"
-        var.data_type = canopen.objectdictionary.UNSIGNED32
-        value = rpdo_mapped_index << 16
-        value += rpdo_mapped_subindex << 8
-        if rpdo_mapped_subindex == 0:
-            rpdo_mapped_obj = rpdo_node_od[rpdo_mapped_index]
-        else:
-            rpdo_mapped_obj = rpdo_node_od[rpdo_mapped_index][rpdo_mapped_subindex]
-        value += OD_DATA_TYPES[rpdo_mapped_obj.data_type].size
-        var.default = value
+        var.data_type = UNSIGNED32
+        var.default = (
+            (rpdo_mapped_index << 16)
+            | (rpdo_mapped_subindex << 8)
+            | OD_DATA_TYPES[rpdo_mapped_obj.data_type].size
+        )
         rpdo_mapping_rec.add_member(var)
 
-        # update these
-        if not time_sync_tpdo:
-            rpdo_mapped_rec[0].default += 1
-        rpdo_mapping_rec[0].default += 1
+    if not time_sync_tpdo:
+        mapped_var0.default = rpdo_mapped_subindex
 
 
 def _add_node_rpdo_data(
@@ -475,87 +483,104 @@ def _add_all_rpdo_data(
         _add_rpdo_data(i, master_node_od, node_od, node_name)
 
 
-def _load_std_objs(
-    file_path: abc.Traversable, node_ids: dict[str, int]
-) -> dict[str, Union[Variable, Record, Array]]:
-    """Load the standard objects."""
+@cache
+def _load_std_objs() -> dict[str, IndexObject]:
+    """Load the standard object configs.
+
+    The canopen objects are made from these with _make_obj for each OD that uses them, which is
+    much cheaper than deep copying a prebuilt object. The result is cached and shared, so it must
+    not be modified.
+    """
 
-    with resources.as_file(file_path) as path, path.open() as f:
+    with resources.as_file(STD_OBJS_FILE_NAME) as path, path.open() as f:
         std_objs_raw = load(f, Loader=CLoader)
 
     std_objs = {}
     for obj_raw in std_objs_raw:
         obj = from_dict(data_class=IndexObject, data=obj_raw)
-        if obj.object_type == "variable":
-            std_objs[obj.name] = _make_var(obj, obj.index)
-        elif obj.object_type == "record":
-            std_objs[obj.name] = _make_rec(obj)
-        elif obj.object_type == "array":
-            std_objs[obj.name] = _make_arr(obj, node_ids)
+        std_objs[obj.name] = obj
     return std_objs
 
 
 def overlay_configs(card_config: CardConfig, overlay_config: CardConfig) -> None:
-    """deal with overlays"""
+    """deal with overlays
+
+    The objects, tpdos and rpdos of card_config may be shared with the configs cached by
+    CardConfig.from_yaml, so they are never changed in place; the lists are copied and any
+    overlayed entry is replaced by an updated copy.
+    """
 
     # overlay object
+    card_config.objects = list(card_config.objects)
+    obj_pos = {obj.index: i for i, obj in enumerate(card_config.objects)}
     for obj in overlay_config.objects:
-        overlayed = False
-        for obj2 in card_config.objects:
-            if obj.index != obj2.index:
-                continue
-
-            obj2.name = obj.name
-            if obj.object_type == "variable":
-                obj2.data_type = obj.data_type
-                obj2.access_type = obj.access_type
-                obj2.high_limit = obj.high_limit
-                obj2.low_limit = obj.low_limit
-            else:
-                for sub_obj in obj.subindexes:
-                    sub_overlayed = False
-                    for sub_obj2 in obj2.subindexes:
-                        if sub_obj.subindex == sub_obj2.subindex:
-                            sub_obj2.name = sub_obj.name
-                            sub_obj2.data_type = sub_obj.data_type
-                            sub_obj2.access_type = sub_obj.access_type
-                            sub_obj2.high_limit = sub_obj.high_limit
-                            sub_obj2.low_limit = sub_obj.low_limit
-                            overlayed = True
-                            sub_overlayed = True
-                            break  # obj was found, search for next one
-                    if not sub_overlayed:  # add it
-                        obj2.subindexes.append(deepcopy(sub_obj))
-            overlayed = True
-            break  # obj was found, search for next one
-        if not overlayed:  # add it
-            card_config.objects.append(deepcopy(obj))
+        i = obj_pos.get(obj.index)
+        if i is None:  # add it
+            obj_pos[obj.index] = len(card_config.objects)
+            card_config.objects.append(obj)
+            continue
+
+        obj2 = card_config.objects[i]
+        if obj.object_type == "variable":
+            obj2 = replace(
+                obj2,
+                name=obj.name,
+                data_type=obj.data_type,
+                access_type=obj.access_type,
+                high_limit=obj.high_limit,
+                low_limit=obj.low_limit,
+            )
+        else:
+            obj2 = replace(obj2, name=obj.name, subindexes=list(obj2.subindexes))
+            sub_pos = {sub_obj.subindex: j for j, sub_obj in enumerate(obj2.subindexes)}
+            for sub_obj in obj.subindexes:
+                j = sub_pos.get(sub_obj.subindex)
+                if j is None:  # add it
+                    sub_pos[sub_obj.subindex] = len(obj2.subindexes)
+                    obj2.subindexes.append(sub_obj)
+                    continue
+
+                obj2.subindexes[j] = replace(
+                    obj2.subindexes[j],
+                    name=sub_obj.name,
+                    data_type=sub_obj.data_type,
+                    access_type=sub_obj.access_type,
+                    high_limit=sub_obj.high_limit,
+                    low_limit=sub_obj.low_limit,
+                )
+        card_config.objects[i] = obj2
 
     # overlay tpdos
+    card_config.tpdos = list(card_config.tpdos)
+    tpdo_pos = {tpdo.num: i for i, tpdo in enumerate(card_config.tpdos)}
     for overlay_tpdo in overlay_config.tpdos:
-        overlayed = False
-        for card_tpdo in card_config.tpdos:
-            if card_tpdo.num == card_tpdo.num:
-                card_tpdo.fields = overlay_tpdo.fields
-                card_tpdo.event_timer_ms = overlay_tpdo.event_timer_ms
-                card_tpdo.inhibit_time_ms = overlay_tpdo.inhibit_time_ms
-                card_tpdo.sync = overlay_tpdo.sync
-                overlayed = True
-                break
-        if not overlayed:  # add it
-            card_config.tpdos.append(deepcopy(overlay_tpdo))
+        i = tpdo_pos.get(overlay_tpdo.num)
+        if i is None:  # add it
+            tpdo_pos[overlay_tpdo.num] = len(card_config.tpdos)
+            card_config.tpdos.append(overlay_tpdo)
+            continue
+
+        card_config.tpdos[i] = replace(
+            card_config.tpdos[i],
+            fields=overlay_tpdo.fields,
+            event_timer_ms=overlay_tpdo.event_timer_ms,
+            inhibit_time_ms=overlay_tpdo.inhibit_time_ms,
+            sync=overlay_tpdo.sync,
+        )
 
     # overlay rpdos
+    card_config.rpdos = list(card_config.rpdos)
+    rpdo_pos = {rpdo.num: i for i, rpdo in enumerate(card_config.rpdos)}
     for overlay_rpdo in overlay_config.rpdos:
-        overlayed = False
-        for card_rpdo in card_config.rpdos:
-            if card_rpdo.num == card_rpdo.num:
-                card_rpdo.card = overlay_rpdo.card
-                card_rpdo.tpdo_num = overlay_rpdo.tpdo_num
-                overlayed = True
-                break
-        if not overlayed:  # add it
-            card_config.rpdos.append(deepcopy(overlay_rpdo))
+        i = rpdo_pos.get(overlay_rpdo.num)
+        if i is None:  # add it
+            rpdo_pos[overlay_rpdo.num] = len(card_config.rpdos)
+            card_config.rpdos.append(overlay_rpdo)
+            continue
+
+        card_config.rpdos[i] = replace(
+            card_config.rpdos[i], card=overlay_rpdo.card, tpdo_num=overlay_rpdo.tpdo_num
+        )
 
 
 def _load_configs(
@@ -588,10 +613,6 @@ def _load_configs(
         if card.base in overlays:
             with resources.as_file(overlays[card.base]) as path:
                 overlay_config = CardConfig.from_yaml(path)
-            # because conf is cached by CardConfig, if multiple missions are loaded, the cached
-            # version should not be modified because the changes will persist to later loaded
-            # missions.
-            conf = deepcopy(conf)
             overlay_configs(conf, overlay_config)
 
         configs[name] = conf
@@ -609,46 +630,49 @@ def _gen_od_db(
     node_ids = {name: cards[name].node_id for name in configs}
     node_ids["c3"] = 0x1
 
-    std_objs = _load_std_objs(STD_OBJS_FILE_NAME, node_ids)
+    std_objs = _load_std_objs()
+    sat_id_names = {sat.id: sat.name.lower() for sat in Mission}
 
     # make od with common and card objects and tpdos
     for name, config in configs.items():
-        od = canopen.ObjectDictionary()
+        card = cards[name]
+        od = ObjectDictionary()
         od.bitrate = 1_000_000  # bps
-        od.node_id = cards[name].node_id
-        od.device_information.allowed_baudrates = set([1000])
-        od.device_information.vendor_name = "PSAS"
-        od.device_information.vendor_number = 0
-        od.device_information.product_name = cards[name].nice_name
-        od.device_information.product_number = 0
-        od.device_information.revision_number = 0
-        od.device_information.order_code = 0
-        od.device_information.simple_boot_up_master = False
-        od.device_information.simple_boot_up_slave = False
-        od.device_information.granularity = 8
-        od.device_information.dynamic_channels_supported = False
-        od.device_information.group_messaging = False
-        od.device_information.nr_of_RXPDO = 0
-        od.device_information.nr_of_TXPDO = 0
-        od.device_information.LSS_supported = False
+        od.node_id = card.node_id
+        dev_info = od.device_information
+        dev_info.allowed_baudrates = set([1000])
+        dev_info.vendor_name = "PSAS"
+        dev_info.vendor_number = 0
+        dev_info.product_name = card.nice_name
+        dev_info.product_number = 0
+        dev_info.revision_number = 0
+        dev_info.order_code = 0
+        dev_info.simple_boot_up_master = False
+        dev_info.simple_boot_up_slave = False
+        dev_info.granularity = 8
+        dev_info.dynamic_channels_supported = False
+        dev_info.group_messaging = False
+        dev_info.nr_of_RXPDO = 0
+        dev_info.nr_of_TXPDO = 0
+        dev_info.LSS_supported = False
 
         # add common and card records
         _add_objects(od, config.objects, node_ids)
 
         # add any standard objects
         for obj_name in config.std_objects:
-            od[std_objs[obj_name].index] = deepcopy(std_objs[obj_name])
+            od.add_object(_make_obj(std_objs[obj_name], node_ids))
             if obj_name == "cob_id_emergency_message":
-                od["cob_id_emergency_message"].default = 0x80 + cards[name].node_id
+                od["cob_id_emergency_message"].default = 0x80 + card.node_id
 
         # add TPDSs
         _add_tpdo_data(od, config)
 
         # set specific obj defaults
         od["versions"]["configs_version"].default = __version__
-        od["satellite_id"].default = mission.id
-        for sat in Mission:
-            od["satellite_id"].value_descriptions[sat.id] = sat.name.lower()
+        satellite_id = od["satellite_id"]
+        satellite_id.default = mission.id
+        satellite_id.value_descriptions.update(sat_id_names)
         if name == "c3":
             od["beacon"]["revision"].default = beacon_def.revision
             od["beacon"]["dest_callsign"].default = beacon_def.ax25.dest_callsign
@@ -672,12 +696,12 @@ def _gen_od_db(
 
     # set all object values to its default value
     for od in od_db.values():
-        for index in od:
-            if not isinstance(od[index], canopen.objectdictionary.Variable):
-                for subindex in od[index]:
-                    od[index][subindex].value = od[index][subindex].default
+        for obj in od.values():
+            if isinstance(obj, Variable):
+                obj.value = obj.default
             else:
-                od[index].value = od[index].default
+                for sub_obj in obj.values():
+                    sub_obj.value = sub_obj.default
 
     return od_db
 
@@ -716,36 +740,37 @@ def _gen_c3_beacon_defs(c3_od: ObjectDictionary, beacon_def: BeaconConfig) -> li
     return beacon_objs
 
 
-def _gen_fw_base_od(mission: Mission) -> canopen.ObjectDictionary:
+def _gen_fw_base_od(mission: Mission) -> ObjectDictionary:
     """Generate all ODs for a OreSat mission."""
 
-    od = canopen.ObjectDictionary()
+    od = ObjectDictionary()
     od.bitrate = 1_000_000  # bps
     od.node_id = 0x7C
-    od.device_information.allowed_baudrates = set([1000])  # kpbs
-    od.device_information.vendor_name = "PSAS"
-    od.device_information.vendor_number = 0
-    od.device_information.product_name = "Firmware Base"
-    od.device_information.product_number = 0
-    od.device_information.revision_number = 0
-    od.device_information.order_code = 0
-    od.device_information.simple_boot_up_master = False
-    od.device_information.simple_boot_up_slave = False
-    od.device_information.granularity = 8
-    od.device_information.dynamic_channels_supported = False
-    od.device_information.group_messaging = False
-    od.device_information.nr_of_RXPDO = 0
-    od.device_information.nr_of_TXPDO = 0
-    od.device_information.LSS_supported = False
+    dev_info = od.device_information
+    dev_info.allowed_baudrates = set([1000])  # kpbs
+    dev_info.vendor_name = "PSAS"
+    dev_info.vendor_number = 0
+    dev_info.product_name = "Firmware Base"
+    dev_info.product_number = 0
+    dev_info.revision_number = 0
+    dev_info.order_code = 0
+    dev_info.simple_boot_up_master = False
+    dev_info.simple_boot_up_slave = False
+    dev_info.granularity = 8
+    dev_info.dynamic_channels_supported = False
+    dev_info.group_messaging = False
+    dev_info.nr_of_RXPDO = 0
+    dev_info.nr_of_TXPDO = 0
+    dev_info.LSS_supported = False
 
     with resources.as_file(resources.files(base) / "fw_common.yaml") as path:
         config = CardConfig.from_yaml(path)
 
     _add_objects(od, config.objects, {})
 
-    std_objs = _load_std_objs(STD_OBJS_FILE_NAME, {})
+    std_objs = _load_std_objs()
     for name in config.std_objects:
-        od[std_objs[name].index] = deepcopy(std_objs[name])
+        od.add_object(_make_obj(std_objs[name], {}))
         if name == "cob_id_emergency_message":
             od["cob_id_emergency_message"].default = 0x80 + od.node_id
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
 from dacite import from_dict
@@ -81,6 +82,7 @@ class BeaconConfig:
     """
 
     @classmethod
+    @cache
     def from_yaml(cls, config_path: Path) -> BeaconConfig:
         """Load a beacon YAML config file."""
 
@@ -0,0 +1,14 @@
+"""Scripts for the oresat-configs CLI."""
+
+from ..constants import Mission
+
+MISSION_CHOICES = [m.arg for m in Mission]
+"""Valid values for the --oresat argument shared by the scripts, computed once at import"""
+
+DEFAULT_MISSION = Mission.default().arg
+"""Default value for the --oresat argument"""
+
+
+def mission_arg(value: str) -> str:
+    """Argparse type for the --oresat argument; accepts ``0.5``, ``OreSat0.5``, etc."""
+    return value.lower().removeprefix("oresat")
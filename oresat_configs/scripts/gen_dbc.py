@@ -5,7 +5,8 @@ from typing import Optional
 
 from canopen.objectdictionary import REAL32, REAL64, UNSIGNED_TYPES, Variable
 
-from .. import Mission, OreSatConfig, __version__
+from .. import OreSatConfig, __version__
+from . import DEFAULT_MISSION, MISSION_CHOICES, mission_arg
 
 GEN_DBC = "generate dbc file for SavvyCAN"
 
@@ -127,9 +128,9 @@ def build_parser(parser: ArgumentParser) -> ArgumentParser:
     parser.description = GEN_DBC
     parser.add_argument(
         "--oresat",
-        default=Mission.default().arg,
-        choices=[m.arg for m in Mission],
-        type=lambda x: x.lower().removeprefix("oresat"),
+        default=DEFAULT_MISSION,
+        choices=MISSION_CHOICES,
+        type=mission_arg,
         help="Oresat Mission. (Default: %(default)s)",
     )
     parser.add_argument("-d", "--dir-path", default=".", help='directory path; default "."')
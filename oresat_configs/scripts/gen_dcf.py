@@ -7,7 +7,8 @@ from typing import Any, Optional
 import canopen
 from canopen.objectdictionary import Variable
 
-from .. import Mission, OreSatConfig
+from .. import OreSatConfig
+from . import DEFAULT_MISSION, MISSION_CHOICES, mission_arg
 
 GEN_DCF = "generate DCF file for OreSat node(s)"
 
@@ -20,9 +21,9 @@ def build_parser(parser: ArgumentParser) -> ArgumentParser:
     parser.description = GEN_DCF
     parser.add_argument(
         "--oresat",
-        default=Mission.default().arg,
-        choices=[m.arg for m in Mission],
-        type=lambda x: x.lower().removeprefix("oresat"),
+        default=DEFAULT_MISSION,
+        choices=MISSION_CHOICES,
+        type=mission_arg,
         help="Oresat Mission. (Default: %(default)s)",
     )
     parser.add_argument("card", help="card name; all, c3, gps, star_tracker_1, etc")
@@ -127,8 +128,7 @@ def write_od(od: canopen.ObjectDictionary, dir_path: str = ".") -> None:
         if i in od:
             mandatory_objs.append(i)
     lines.append(f"SupportedObjects={len(mandatory_objs)}")
-    for i in mandatory_objs:
-        num = mandatory_objs.index(i) + 1
+    for num, i in enumerate(mandatory_objs, 1):
         value = f"0x{i:04X}"
         lines.append(f"{num}={value}")
     lines.append("")
@@ -141,8 +141,7 @@ def write_od(od: canopen.ObjectDictionary, dir_path: str = ".") -> None:
         if (i >= 0x1002 and i <= 0x1FFF and i != 0x1018) or (i >= 0x6000 and i <= 0xFFFF):
             optional_objs.append(i)
     lines.append(f"SupportedObjects={len(optional_objs)}")
-    for i in optional_objs:
-        num = optional_objs.index(i) + 1
+    for num, i in enumerate(optional_objs, 1):
         value = f"0x{i:04X}"
         lines.append(f"{num}={value}")
     lines.append("")
@@ -155,8 +154,7 @@ def write_od(od: canopen.ObjectDictionary, dir_path: str = ".") -> None:
         if i >= 0x2000 and i <= 0x5FFF:
             manufacturer_objs.append(i)
     lines.append(f"SupportedObjects={len(manufacturer_objs)}")
-    for i in manufacturer_objs:
-        num = manufacturer_objs.index(i) + 1
+    for num, i in enumerate(manufacturer_objs, 1):
         value = f"0x{i:04X}"
         lines.append(f"{num}={value}")
     lines.append("")
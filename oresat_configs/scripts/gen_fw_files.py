@@ -3,13 +3,14 @@
 import os
 import sys
 from argparse import ArgumentParser, Namespace
-from itertools import chain
+from itertools import chain, islice
 from typing import Any, Optional
 
 import canopen
 from canopen.objectdictionary.datatypes import DOMAIN, OCTET_STRING, UNICODE_STRING, VISIBLE_STRING
 
-from .. import Mission, OreSatConfig
+from .. import OreSatConfig
+from . import DEFAULT_MISSION, MISSION_CHOICES, mission_arg
 
 GEN_FW_FILES = "generate CANopenNode OD.[c/h] files for a OreSat firmware card"
 
@@ -22,9 +23,9 @@ def build_parser(parser: ArgumentParser) -> ArgumentParser:
     parser.description = GEN_FW_FILES
     parser.add_argument(
         "--oresat",
-        default=Mission.default().arg,
-        choices=[m.arg for m in Mission],
-        type=lambda x: x.lower().removeprefix("oresat"),
+        default=DEFAULT_MISSION,
+        choices=MISSION_CHOICES,
+        type=mission_arg,
         help="Oresat Mission. (Default: %(default)s)",
     )
     parser.add_argument(
@@ -58,9 +59,12 @@ INDENT4 = " " * 4
 INDENT8 = " " * 8
 INDENT12 = " " * 12
 
-_SKIP_INDEXES = [0x1F81, 0x1F82, 0x1F89]
+_SKIP_INDEXES = frozenset((0x1F81, 0x1F82, 0x1F89))
 """CANopenNode skips the data (it just set to NULL) for these indexes for some reason"""
 
+_BYTE_HEX = tuple(f"0x{b:02X}" for b in range(256))
+"""C hex literal for every byte value, indexed by the byte"""
+
 DATA_TYPE_C_TYPES = {
     canopen.objectdictionary.datatypes.BOOLEAN: "bool_t",
     canopen.objectdictionary.datatypes.INTEGER8: "int8_t",
@@ -106,11 +110,7 @@ def write_canopennode(od: canopen.ObjectDictionary, dir_path: str = ".") -> None
         be used.
     """
 
-    if dir_path[-1] == "/":
-        dir_path = dir_path[:-1]
-
-    if not os.path.isdir(dir_path):
-        os.makedirs(dir_path)
+    os.makedirs(dir_path, exist_ok=True)
 
     write_canopennode_c(od, dir_path)
     write_canopennode_h(od, dir_path)
@@ -122,7 +122,7 @@ def initializer(obj: canopen.objectdictionary.Variable) -> str:
     if obj.data_type == canopen.objectdictionary.datatypes.VISIBLE_STRING:
         return "{" + ", ".join(f"'{c}'" for c in chain(obj.default, ["\\0"])) + "}"
     if obj.data_type == canopen.objectdictionary.datatypes.OCTET_STRING:
-        return "{" + ", ".join(f"0x{b:02X}" for b in obj.default) + "}"
+        return "{" + ", ".join([_BYTE_HEX[b] for b in obj.default]) + "}"
     if obj.data_type == canopen.objectdictionary.datatypes.UNICODE_STRING:
         return "{" + ", ".join(f"0x{ord(c):04X}" for c in chain(obj.default, "\0")) + "}"
     if obj.data_type in canopen.objectdictionary.datatypes.INTEGER_TYPES:
@@ -146,12 +146,12 @@ def attr_lines(od: canopen.ObjectDictionary, index: int) -> list[str]:
 
     if isinstance(obj, canopen.objectdictionary.Array):
         lines = [f"{INDENT4}.x{index:X}_{obj.name}_sub0 = {obj[0].default},"]
-        if obj[list(obj.subindices)[1]].data_type == DOMAIN:
+        if obj[next(islice(obj.subindices, 1, None))].data_type == DOMAIN:
             return lines  # skip domains
 
         lines.append(
             f"{INDENT4}.x{index:X}_{obj.name} = {{"
-            + ", ".join(initializer(obj[i]) for i in list(obj.subindices)[1:])
+            + ", ".join(initializer(obj[i]) for i in islice(obj.subindices, 1, None))
             + "},"
         )
         return lines
@@ -227,7 +227,7 @@ def obj_entry_body(index: int, obj: canopen.objectdictionary.Variable) -> list[s
             f".dataLength = {_var_data_type_len(obj)}",
         ]
     if isinstance(obj, canopen.objectdictionary.Array):
-        first_obj = obj[list(obj.subindices)[1]]
+        first_obj = obj[next(islice(obj.subindices, 1, None))]
         c_name = DATA_TYPE_C_TYPES[first_obj.data_type]
         if first_obj.data_type == DOMAIN:
             size = "0"
@@ -265,9 +265,10 @@ def obj_entry_body(index: int, obj: canopen.objectdictionary.Variable) -> list[s
 def obj_lines(od: canopen.ObjectDictionary, index: int) -> list[str]:
     """Generate lines for OD.c for a specific index"""
 
+    obj = od[index]
     return [
-        f"{INDENT4}.o_{index:X}_{od[index].name} = {{",
-        *(INDENT8 + line for line in obj_entry_body(index, od[index])),
+        f"{INDENT4}.o_{index:X}_{obj.name} = {{",
+        *(INDENT8 + line for line in obj_entry_body(index, obj)),
         f"{INDENT4}}},",
     ]
 
@@ -286,10 +287,7 @@ def write_canopennode_c(od: canopen.ObjectDictionary, dir_path: str = ".") -> No
 
     lines = []
 
-    if dir_path:
-        file_path = dir_path + "/OD.c"
-    else:  # use value od/dcf path
-        file_path = "OD.c"
+    file_path = os.path.join(dir_path, "OD.c")
 
     lines.append("#define OD_DEFINITION")
     lines.append('#include "301/CO_ODinterface.h"')
@@ -301,45 +299,46 @@ def write_canopennode_c(od: canopen.ObjectDictionary, dir_path: str = ".") -> No
     lines.append("#endif")
     lines.append("")
 
+    ram_lines = []
+    typedef_lines = []
+    objs_lines = []
+    list_lines = []
+    for i, obj in od.items():
+        name = f"o_{i:X}_{obj.name}"  # formatted once, used by ODObjs_t and ODList
+        ram_lines += attr_lines(od, i)
+        objs_lines += obj_lines(od, i)
+        if isinstance(obj, canopen.objectdictionary.Variable):
+            typedef_lines.append(f"{INDENT4}OD_obj_var_t {name};")
+            length = 1
+            obj_type = "ODT_VAR"
+        elif isinstance(obj, canopen.objectdictionary.Array):
+            typedef_lines.append(f"{INDENT4}OD_obj_array_t {name};")
+            length = len(obj)
+            obj_type = "ODT_ARR"
+        else:
+            length = len(obj)
+            typedef_lines.append(f"{INDENT4}OD_obj_record_t {name}[{length}];")
+            obj_type = "ODT_REC"
+        temp = f"0x{i:X}, 0x{length:02X}, {obj_type}, &ODObjs.{name}, NULL"
+        list_lines.append(INDENT4 + "{" + temp + "},")
+
     lines.append("OD_ATTR_RAM OD_RAM_t OD_RAM = {")
-    for j in od:
-        lines += attr_lines(od, j)
+    lines += ram_lines
     lines.append("};")
     lines.append("")
 
     lines.append("typedef struct {")
-    for i in od:
-        name = od[i].name
-        if isinstance(od[i], canopen.objectdictionary.Variable):
-            lines.append(f"{INDENT4}OD_obj_var_t o_{i:X}_{name};")
-        elif isinstance(od[i], canopen.objectdictionary.Array):
-            lines.append(f"{INDENT4}OD_obj_array_t o_{i:X}_{name};")
-        else:
-            size = len(od[i])
-            lines.append(f"{INDENT4}OD_obj_record_t o_{i:X}_{name}[{size}];")
+    lines += typedef_lines
     lines.append("} ODObjs_t;")
     lines.append("")
 
     lines.append("static CO_PROGMEM ODObjs_t ODObjs = {")
-    for i in od:
-        lines += obj_lines(od, i)
+    lines += objs_lines
     lines.append("};")
     lines.append("")
 
     lines.append("static OD_ATTR_OD OD_entry_t ODList[] = {")
-    for i in od:
-        name = od[i].name
-        if isinstance(od[i], canopen.objectdictionary.Variable):
-            length = 1
-            obj_type = "ODT_VAR"
-        elif isinstance(od[i], canopen.objectdictionary.Array):
-            length = len(od[i])
-            obj_type = "ODT_ARR"
-        else:
-            length = len(od[i])
-            obj_type = "ODT_REC"
-        temp = f"0x{i:X}, 0x{length:02X}, {obj_type}, &ODObjs.o_{i:X}_{name}, NULL"
-        lines.append(INDENT4 + "{" + temp + "},")
+    lines += list_lines
     lines.append(INDENT4 + "{0x0000, 0x00, 0, NULL, NULL}")
     lines.append("};")
     lines.append("")
@@ -382,7 +381,7 @@ def _canopennode_h_lines(od: canopen.ObjectDictionary, index: int) -> list[str]:
     if isinstance(obj, canopen.objectdictionary.Variable):
         return decl_type(obj, name)
     if isinstance(obj, canopen.objectdictionary.Array):
-        sub = obj[list(obj.subindices)[1]]
+        sub = obj[next(islice(obj.subindices, 1, None))]
         return [
             f"{INDENT4}uint8_t {name}_sub0;",
             *decl_type(sub, f"{name}[OD_CNT_ARR_{index:X}]"),
@@ -410,10 +409,7 @@ def write_canopennode_h(od: canopen.ObjectDictionary, dir_path: str = ".") -> No
 
     lines = []
 
-    if dir_path:
-        file_path = dir_path + "/OD.h"
-    else:  # use value od/dcf path
-        file_path = "OD.h"
+    file_path = os.path.join(dir_path, "OD.h")
 
     lines.append("#ifndef OD_H")
     lines.append("#define OD_H")
@@ -445,9 +441,9 @@ def write_canopennode_h(od: canopen.ObjectDictionary, dir_path: str = ".") -> No
     lines.append(f"#define OD_CNT_TPDO {od.device_information.nr_of_TXPDO}")
     lines.append("")
 
-    for i in od:
-        if isinstance(od[i], canopen.objectdictionary.Array):
-            lines.append(f"#define OD_CNT_ARR_{i:X} {len(od[i]) - 1}")
+    for i, obj in od.items():
+        if isinstance(obj, canopen.objectdictionary.Array):
+            lines.append(f"#define OD_CNT_ARR_{i:X} {len(obj) - 1}")
     lines.append("")
 
     lines.append("typedef struct {")
@@ -468,32 +464,29 @@ def write_canopennode_h(od: canopen.ObjectDictionary, dir_path: str = ".") -> No
     lines.append("extern OD_ATTR_OD OD_t *OD;")
     lines.append("")
 
-    num = 0
-    for i in od:
-        lines.append(f"#define OD_ENTRY_H{i:X} &OD->list[{num}]")
-        num += 1
+    entry_lines = []
+    named_entry_lines = []
+    for num, (i, obj) in enumerate(od.items()):
+        entry_lines.append(f"#define OD_ENTRY_H{i:X} &OD->list[{num}]")
+        named_entry_lines.append(f"#define OD_ENTRY_H{i:X}_{obj.name.upper()} &OD->list[{num}]")
+    lines += entry_lines
     lines.append("")
-
-    num = 0
-    for i in od:
-        name = od[i].name
-        lines.append(f"#define OD_ENTRY_H{i:X}_{name.upper()} &OD->list[{num}]")
-        num += 1
+    lines += named_entry_lines
     lines.append("")
 
     # add nice #defines for indexes and subindex values
-    for i in od:
+    for i, obj in od.items():
         if i < 0x2000:
             continue  # only care about common, card, and RPDO mapped objects
 
-        name = od[i].name
+        name = obj.name
         lines.append(f"#define OD_INDEX_{name.upper()} 0x{i:X}")
 
-        if not isinstance(od[i], canopen.objectdictionary.Variable):
-            for j in od[i]:
+        if not isinstance(obj, canopen.objectdictionary.Variable):
+            for j, sub in obj.items():
                 if j == 0:
                     continue
-                sub_name = f"{name}_" + od[i][j].name
+                sub_name = f"{name}_" + sub.name
                 lines.append(f"#define OD_SUBINDEX_{sub_name.upper()} 0x{j:X}")
         lines.append("")
 
@@ -501,7 +494,7 @@ def write_canopennode_h(od: canopen.ObjectDictionary, dir_path: str = ".") -> No
         if isinstance(obj, canopen.objectdictionary.Variable):
             lines += _make_enum_lines(obj)
         elif isinstance(obj, canopen.objectdictionary.Array):
-            subindex = list(obj.subindices.keys())[1]
+            subindex = next(islice(obj.subindices, 1, None))
             lines += _make_enum_lines(obj[subindex])
         else:
             for subindex, sub_obj in obj.subindices.items():
@@ -511,7 +504,7 @@ def write_canopennode_h(od: canopen.ObjectDictionary, dir_path: str = ".") -> No
         if isinstance(obj, canopen.objectdictionary.Variable):
             lines += _make_bitfields_lines(obj)
         elif isinstance(obj, canopen.objectdictionary.Array):
-            subindex = list(obj.subindices.keys())[1]
+            subindex = next(islice(obj.subindices, 1, None))
             lines += _make_bitfields_lines(obj[subindex])
         else:
             for subindex in obj.subindices:
@@ -618,16 +611,19 @@ def gen_fw_files(args: Optional[Namespace] = None) -> None:
     if 0x1014 in od:
         od[0x1014].default = 0x80
 
+    node_id = od.node_id
     max_pdos = 12 if arg_card == "c3" else 16
-    tpdo_cob_ids = [0x180 + (0x100 * (i % 4)) + (i // 4) + od.node_id for i in range(max_pdos)]
-    rpdo_cob_ids = [i + 0x80 for i in tpdo_cob_ids]
+    tpdo_cob_ids = frozenset(
+        0x180 + (0x100 * (i % 4)) + (i // 4) + node_id for i in range(max_pdos)
+    )
+    rpdo_cob_ids = frozenset(i + 0x80 for i in tpdo_cob_ids)
 
-    def _remove_pdo_cob_ids(start: int, num: int, cob_ids: list[int]):
+    def _remove_pdo_cob_ids(start: int, num: int, cob_ids: frozenset[int]):
         for index in range(start, start + num):
             obj = od[index]
             default = obj[1].default
             if default & 0x7FF in cob_ids:
-                cob_id = (default - od.node_id) & 0xFFC
+                cob_id = (default - node_id) & 0xFFC
                 cob_id += default & 0xC0_00_00_00  # add back pdo flags (2 MSBs)
             else:
                 cob_id = default
@@ -1,13 +1,37 @@
 """Generate KaiTai for the beacon."""
 
+import json
+import os
+import re
 from argparse import ArgumentParser, Namespace
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import repeat
+from textwrap import indent
 from typing import Any, Optional
 
-import canopen
-from canopen.objectdictionary import Array, Record
-from yaml import dump
+from canopen.objectdictionary import (
+    BOOLEAN,
+    INTEGER8,
+    INTEGER16,
+    INTEGER32,
+    INTEGER64,
+    REAL32,
+    REAL64,
+    UNSIGNED8,
+    UNSIGNED16,
+    UNSIGNED32,
+    UNSIGNED64,
+    VISIBLE_STRING,
+    Array,
+    Record,
+    Variable,
+)
+from yaml import CSafeDumper, dump
 
-from .. import Mission, OreSatConfig
+from .. import OreSatConfig
+from . import DEFAULT_MISSION, MISSION_CHOICES, mission_arg
 
 GEN_KAITAI = "generate beacon kaitai configuration"
 
@@ -20,14 +44,24 @@ def build_parser(parser: ArgumentParser) -> ArgumentParser:
     parser.description = GEN_KAITAI
     parser.add_argument(
         "--oresat",
-        default=Mission.default().arg,
-        choices=[m.arg for m in Mission],
-        type=lambda x: x.lower().removeprefix("oresat"),
-        help="Oresat Mission. (Default: %(default)s)",
+        default=DEFAULT_MISSION,
+        choices=[*MISSION_CHOICES, "all"],
+        type=mission_arg,
+        help="Oresat Mission, or all to generate every mission in parallel. (Default: %(default)s)",
     )
     parser.add_argument(
         "-d", "--dir-path", default=".", help="Output directory path. (Default: %(default)s)"
     )
+    parser.add_argument(
+        "-f",
+        "--format",
+        default="yaml",
+        choices=["yaml", "json"],
+        help="Output format, json writes a .ksy.json file. (Default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-docs", action="store_true", help="Leave the doc and doc-ref keys out of the output."
+    )
     return parser
 
 
@@ -46,29 +80,251 @@ def register_subparser(subparsers: Any) -> None:
 
 
 CANOPEN_TO_KAITAI_DT = {
-    canopen.objectdictionary.BOOLEAN: "b1",
-    canopen.objectdictionary.INTEGER8: "s1",
-    canopen.objectdictionary.INTEGER16: "s2",
-    canopen.objectdictionary.INTEGER32: "s4",
-    canopen.objectdictionary.INTEGER64: "s8",
-    canopen.objectdictionary.UNSIGNED8: "u1",
-    canopen.objectdictionary.UNSIGNED16: "u2",
-    canopen.objectdictionary.UNSIGNED32: "u4",
-    canopen.objectdictionary.UNSIGNED64: "u8",
-    canopen.objectdictionary.VISIBLE_STRING: "str",
-    canopen.objectdictionary.REAL32: "f4",
-    canopen.objectdictionary.REAL64: "f8",
+    BOOLEAN: "b1",
+    INTEGER8: "s1",
+    INTEGER16: "s2",
+    INTEGER32: "s4",
+    INTEGER64: "s8",
+    UNSIGNED8: "u1",
+    UNSIGNED16: "u2",
+    UNSIGNED32: "u4",
+    UNSIGNED64: "u8",
+    VISIBLE_STRING: "str",
+    REAL32: "f4",
+    REAL64: "f8",
 }
 
+_KAITAI_DT_BY_CODE = tuple(
+    CANOPEN_TO_KAITAI_DT.get(code) for code in range(max(CANOPEN_TO_KAITAI_DT) + 1)
+)
+"""CANOPEN_TO_KAITAI_DT as a tuple indexed by the (small, dense) canopen data type code"""
+
+
+AX25_TYPES = {
+    "ax25_frame": {
+        "seq": [
+            {
+                "id": "ax25_header",
+                "type": "ax25_header",
+            },
+            {
+                "id": "payload",
+                "type": {
+                    "switch-on": "ax25_header.ctl & 0x13",
+                    "cases": {
+                        "0x03": "ui_frame",
+                        "0x13": "ui_frame",
+                        "0x00": "i_frame",
+                        "0x02": "i_frame",
+                        "0x10": "i_frame",
+                        "0x12": "i_frame",
+                    },
+                },
+            },
+            {
+                "id": "ax25_trunk",
+                "type": "ax25_trunk",
+            },
+        ]
+    },
+    "ax25_header": {
+        "seq": [
+            {"id": "dest_callsign_raw", "type": "callsign_raw"},
+            {"id": "dest_ssid_raw", "type": "ssid_mask"},
+            {"id": "src_callsign_raw", "type": "callsign_raw"},
+            {"id": "src_ssid_raw", "type": "ssid_mask"},
+            {
+                "id": "repeater",
+                "type": "repeater",
+                "if": "(src_ssid_raw.ssid_mask & 0x01) == 0",
+                "doc": "Repeater flag is set!",
+            },
+            {"id": "ctl", "type": "u1"},
+        ],
+    },
+    "ax25_trunk": {
+        "seq": [
+            {
+                "id": "refcs",
+                "type": "u4",
+            }
+        ]
+    },
+    "repeater": {
+        "seq": [
+            {
+                "id": "rpt_instance",
+                "type": "repeaters",
+                "repeat": "until",
+                "repeat-until": "((_.rpt_ssid_raw.ssid_mask & 0x1) == 0x1)",
+                "doc": "Repeat until no repeater flag is set!",
+            }
+        ]
+    },
+    "repeaters": {
+        "seq": [
+            {
+                "id": "rpt_callsign_raw",
+                "type": "callsign_raw",
+            },
+            {
+                "id": "rpt_ssid_raw",
+                "type": "ssid_mask",
+            },
+        ]
+    },
+    "callsign_raw": {
+        "seq": [
+            {
+                "id": "callsign_ror",
+                "process": "ror(1)",
+                "size": 6,
+                "type": "callsign",
+            }
+        ]
+    },
+    "callsign": {
+        "seq": [
+            {
+                "id": "callsign",
+                "type": "str",
+                "encoding": "ASCII",
+                "size": 6,
+                "valid": {"any-of": ['"KJ7SAT"', '"SPACE "']},
+            }
+        ]
+    },
+    "ssid_mask": {
+        "seq": [
+            {
+                "id": "ssid_mask",
+                "type": "u1",
+            }
+        ],
+        "instances": {"ssid": {"value": "(ssid_mask & 0x0f) >> 1"}},
+    },
+}
+"""Kaitai types for the AX.25 framing around the beacon payload, the same for every mission"""
+
+
+def _strip_docs(data: Any) -> Any:
+    """Return a copy of kaitai data without any doc or doc-ref keys."""
+
+    if isinstance(data, dict):
+        return {k: _strip_docs(v) for k, v in data.items() if k not in ("doc", "doc-ref")}
+    if isinstance(data, list):
+        return [_strip_docs(v) for v in data]
+    return data
+
+
+@cache
+def _ax25_types(include_docs: bool) -> dict[str, Any]:
+    """The static AX.25 types, optionally without their docs."""
+
+    return AX25_TYPES if include_docs else _strip_docs(AX25_TYPES)
+
+
+@cache
+def _ax25_types_yaml(include_docs: bool) -> bytes:
+    """The ``types`` section header and the static AX.25 types, serialized once."""
+
+    types = {"types": _ax25_types(include_docs)}
+    return dump(types, Dumper=CSafeDumper, sort_keys=False, encoding="utf-8")
+
+
+_YAML_PLAIN_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+"""Strings that can be written as a plain YAML scalar without quoting"""
+
+_YAML_RESERVED_WORDS = {"y", "n", "yes", "no", "true", "false", "on", "off", "null"}
+"""Plain words YAML would load as something other than a str"""
+
 
-def write_kaitai(config: OreSatConfig, dir_path: str = ".") -> None:
-    """Write beacon configs to a kaitai file."""
+KaitaiField = namedtuple(
+    "KaitaiField", ("id", "type", "doc", "encoding", "size"), defaults=(None, None)
+)
+"""An ax25_info_data seq entry, fields left as None are not written"""
+
+
+def _kaitai_field(obj: Variable, include_docs: bool = True) -> KaitaiField:
+    """Make the ax25_info_data seq entry for a beacon object."""
+
+    name = (
+        "_".join([obj.parent.name, obj.name])
+        if isinstance(obj.parent, (Record, Array))
+        else obj.name
+    )
+
+    kaitai_type = None
+    if obj.data_type < len(_KAITAI_DT_BY_CODE):
+        kaitai_type = _KAITAI_DT_BY_CODE[obj.data_type]
+    if kaitai_type is None:
+        raise TypeError(f"Unhandled object {obj.name} datatype: {obj.data_type}")
+
+    doc = obj.description if include_docs else None
+    if obj.data_type != VISIBLE_STRING:
+        return KaitaiField(name, kaitai_type, doc)
+    size = len(obj.default) if obj.access_type == "const" else None
+    return KaitaiField(name, kaitai_type, doc, "ASCII", size)
+
+
+def _kaitai_field_dict(field: KaitaiField) -> dict[str, Any]:
+    """Convert a KaitaiField to the mapping written to the kaitai file."""
+
+    return {key: value for key, value in zip(field._fields, field) if value is not None}
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Format a str or int as a YAML scalar, double-quoting any str that is not a plain word."""
+
+    if not isinstance(value, str):
+        return str(value)
+    if _YAML_PLAIN_WORD.fullmatch(value) and value.lower() not in _YAML_RESERVED_WORDS:
+        return value
+    # let libyaml escape it, a JSON string is not always a valid YAML double-quoted scalar
+    return dump(value, Dumper=CSafeDumper, default_style='"', width=-1).rstrip("\n")
+
+
+def _info_data_yaml(payload_seq: list[KaitaiField]) -> str:
+    """Serialize the ax25_info_data type as YAML text.
+
+    The beacon seq is a flat list of flat mappings, so it is formatted directly instead of going
+    through the YAML emitter.
+    """
+
+    if not payload_seq:
+        return "ax25_info_data:\n  seq: []\n"
+
+    lines = ["ax25_info_data:", "  seq:"]
+    for field in payload_seq:
+        prefix = "  - "
+        for key, value in zip(field._fields, field):
+            if value is None:
+                continue
+            lines.append(f"{prefix}{key}: {_yaml_scalar(value)}")
+            prefix = "    "
+    return "\n".join(lines) + "\n"
+
+
+def write_kaitai(
+    config: OreSatConfig, dir_path: str = ".", fmt: str = "yaml", include_docs: bool = True
+) -> None:
+    """Write beacon configs to a kaitai file.
+
+    With fmt set to ``"json"`` the same structure is written as compact JSON to a ``.ksy.json``
+    file instead, for tools that only need a machine readable copy of the kaitai definition.
+
+    With include_docs set to False all doc and doc-ref keys are left out, which makes for a much
+    smaller file.
+    """
 
     # Grab and format mission name
     filename = config.mission.filename()
 
-    #  Setup pre-determined canned types
-    kaitai_data: Any = {
+    file_path = os.path.join(dir_path, f"{filename}.ksy")
+    if fmt == "json":
+        file_path += ".json"
+
+    kaitai_header = {
         "meta": {
             "id": filename,
             "title": f"{filename} Decoder Struct",
@@ -81,163 +337,62 @@ def write_kaitai(config: OreSatConfig, dir_path: str = ".") -> None:
                 "doc-ref": "https://www.tapr.org/pub_ax25.html",
             }
         ],
-        "types": {
-            "ax25_frame": {
-                "seq": [
-                    {
-                        "id": "ax25_header",
-                        "type": "ax25_header",
-                    },
-                    {
-                        "id": "payload",
-                        "type": {
-                            "switch-on": "ax25_header.ctl & 0x13",
-                            "cases": {
-                                "0x03": "ui_frame",
-                                "0x13": "ui_frame",
-                                "0x00": "i_frame",
-                                "0x02": "i_frame",
-                                "0x10": "i_frame",
-                                "0x12": "i_frame",
-                            },
-                        },
-                    },
-                    {
-                        "id": "ax25_trunk",
-                        "type": "ax25_trunk",
-                    },
-                ]
-            },
-            "ax25_header": {
-                "seq": [
-                    {"id": "dest_callsign_raw", "type": "callsign_raw"},
-                    {"id": "dest_ssid_raw", "type": "ssid_mask"},
-                    {"id": "src_callsign_raw", "type": "callsign_raw"},
-                    {"id": "src_ssid_raw", "type": "ssid_mask"},
-                    {
-                        "id": "repeater",
-                        "type": "repeater",
-                        "if": "(src_ssid_raw.ssid_mask & 0x01) == 0",
-                        "doc": "Repeater flag is set!",
-                    },
-                    {"id": "ctl", "type": "u1"},
-                ],
-            },
-            "ax25_trunk": {
-                "seq": [
-                    {
-                        "id": "refcs",
-                        "type": "u4",
-                    }
-                ]
-            },
-            "repeater": {
-                "seq": [
-                    {
-                        "id": "rpt_instance",
-                        "type": "repeaters",
-                        "repeat": "until",
-                        "repeat-until": "((_.rpt_ssid_raw.ssid_mask & 0x1) == 0x1)",
-                        "doc": "Repeat until no repeater flag is set!",
-                    }
-                ]
-            },
-            "repeaters": {
-                "seq": [
-                    {
-                        "id": "rpt_callsign_raw",
-                        "type": "callsign_raw",
-                    },
-                    {
-                        "id": "rpt_ssid_raw",
-                        "type": "ssid_mask",
-                    },
-                ]
-            },
-            "callsign_raw": {
-                "seq": [
-                    {
-                        "id": "callsign_ror",
-                        "process": "ror(1)",
-                        "size": 6,
-                        "type": "callsign",
-                    }
-                ]
-            },
-            "callsign": {
-                "seq": [
-                    {
-                        "id": "callsign",
-                        "type": "str",
-                        "encoding": "ASCII",
-                        "size": 6,
-                        "valid": {"any-of": ['"KJ7SAT"', '"SPACE "']},
-                    }
-                ]
-            },
-            "ssid_mask": {
-                "seq": [
-                    {
-                        "id": "ssid_mask",
-                        "type": "u1",
-                    }
-                ],
-                "instances": {"ssid": {"value": "(ssid_mask & 0x0f) >> 1"}},
-            },
-            "i_frame": {
-                "seq": [
-                    {
-                        "id": "pid",
-                        "type": "u1",
-                    },
-                    {"id": "ax25_info", "type": "ax25_info_data", "size": -1},
-                ]
-            },
-            "ui_frame": {
-                "seq": [
-                    {
-                        "id": "pid",
-                        "type": "u1",
-                    },
-                    {"id": "ax25_info", "type": "ax25_info_data", "size": -1},
-                ]
-            },
-            "ax25_info_data": {"seq": []},
-        },
     }
+    if not include_docs:
+        kaitai_header = _strip_docs(kaitai_header)
 
     # Append field types for each field
-    payload_size = 0
-
-    for obj in config.beacon_def:
-        name = (
-            "_".join([obj.parent.name, obj.name])
-            if isinstance(obj.parent, (Record, Array))
-            else obj.name
-        )
-
-        new_var = {
-            "id": name,
-            "type": CANOPEN_TO_KAITAI_DT[obj.data_type],
-            "doc": obj.description,
-        }
-        if new_var["type"] == "str":
-            new_var["encoding"] = "ASCII"
-            if obj.access_type == "const":
-                new_var["size"] = len(obj.default)
-            payload_size += new_var["size"] * 8
+    payload_seq = [_kaitai_field(obj, include_docs) for obj in config.beacon_def]
+    payload_bits = sum(
+        field.size * 8 if obj.data_type == VISIBLE_STRING else len(obj)
+        for obj, field in zip(config.beacon_def, payload_seq)
+    )
+    payload_size = payload_bits // 8
+
+    # the frame types depend on the beacon payload, the rest of the types are static
+    frame_types = {
+        "i_frame": {
+            "seq": [
+                {
+                    "id": "pid",
+                    "type": "u1",
+                },
+                {"id": "ax25_info", "type": "ax25_info_data", "size": payload_size},
+            ]
+        },
+        "ui_frame": {
+            "seq": [
+                {
+                    "id": "pid",
+                    "type": "u1",
+                },
+                {"id": "ax25_info", "type": "ax25_info_data", "size": payload_size},
+            ]
+        },
+    }
+
+    # Write kaitai to output file
+    with open(file_path, "wb", buffering=1 << 16) as file:
+        if fmt == "json":
+            info_seq = [_kaitai_field_dict(field) for field in payload_seq]
+            info_type = {"ax25_info_data": {"seq": info_seq}}
+            types = {**_ax25_types(include_docs), **frame_types, **info_type}
+            kaitai_data = {**kaitai_header, "types": types}
+            file.write(json.dumps(kaitai_data, separators=(",", ":")).encode())
         else:
-            payload_size += len(obj)
+            dump(kaitai_header, file, Dumper=CSafeDumper, sort_keys=False, encoding="utf-8")
+            file.write(_ax25_types_yaml(include_docs))
+            # nest the frame types under the already written types section
+            frame_yaml = dump(frame_types, Dumper=CSafeDumper, sort_keys=False)
+            frame_yaml += _info_data_yaml(payload_seq)
+            file.write(indent(frame_yaml, "  ").encode())
 
-        kaitai_data["types"]["ax25_info_data"]["seq"].append(new_var)
 
-    payload_size //= 8
-    kaitai_data["types"]["i_frame"]["seq"][1]["size"] = payload_size
-    kaitai_data["types"]["ui_frame"]["seq"][1]["size"] = payload_size
+def _mission_kaitai(mission: str, dir_path: str, fmt: str, include_docs: bool) -> None:
+    """Load a mission and write its kaitai file, module level so it can run in a worker process."""
 
-    # Write kaitai to output file
-    with open(f"{dir_path}/{filename}.ksy", "w+") as file:
-        dump(kaitai_data, file)
+    config = OreSatConfig(mission)
+    write_kaitai(config, dir_path, fmt, include_docs)
 
 
 def gen_kaitai(args: Optional[Namespace] = None) -> None:
@@ -245,5 +400,13 @@ def gen_kaitai(args: Optional[Namespace] = None) -> None:
     if args is None:
         args = build_parser(ArgumentParser()).parse_args()
 
-    config = OreSatConfig(args.oresat)
-    write_kaitai(config, args.dir_path)
+    if args.oresat == "all":
+        # each mission is independent and both building the ODs and dumping are CPU bound
+        with ProcessPoolExecutor() as executor:
+            dir_paths = repeat(args.dir_path)
+            fmts = repeat(args.format)
+            docs = repeat(not args.no_docs)
+            list(executor.map(_mission_kaitai, MISSION_CHOICES, dir_paths, fmts, docs))
+        return
+
+    _mission_kaitai(args.oresat, args.dir_path, args.format, not args.no_docs)
@@ -1,13 +1,31 @@
 """Generate XTCE for the beacon."""
 
+import os
 import xml.etree.ElementTree as ET
 from argparse import ArgumentParser, Namespace
 from datetime import datetime
 from typing import Any, Optional
 
-import canopen
-
-from .. import Mission, OreSatConfig
+from canopen import ObjectDictionary
+from canopen.objectdictionary import (
+    BOOLEAN,
+    INTEGER8,
+    INTEGER16,
+    INTEGER32,
+    INTEGER64,
+    REAL32,
+    REAL64,
+    UNSIGNED8,
+    UNSIGNED16,
+    UNSIGNED32,
+    UNSIGNED64,
+    UNSIGNED_TYPES,
+    VISIBLE_STRING,
+    Variable,
+)
+
+from .. import OreSatConfig
+from . import DEFAULT_MISSION, MISSION_CHOICES, mission_arg
 
 GEN_XTCE = "generate beacon xtce file"
 
@@ -20,9 +38,9 @@ def build_parser(parser: ArgumentParser) -> ArgumentParser:
     parser.description = GEN_XTCE
     parser.add_argument(
         "--oresat",
-        default=Mission.default().arg,
-        choices=[m.arg for m in Mission],
-        type=lambda x: x.lower().removeprefix("oresat"),
+        default=DEFAULT_MISSION,
+        choices=MISSION_CHOICES,
+        type=mission_arg,
         help="Oresat Mission. (Default: %(default)s)",
     )
     parser.add_argument(
@@ -46,44 +64,44 @@ def register_subparser(subparsers: Any) -> None:
 
 
 CANOPEN_TO_XTCE_DT = {
-    canopen.objectdictionary.BOOLEAN: "bool",
-    canopen.objectdictionary.INTEGER8: "int8",
-    canopen.objectdictionary.INTEGER16: "int16",
-    canopen.objectdictionary.INTEGER32: "int32",
-    canopen.objectdictionary.INTEGER64: "int64",
-    canopen.objectdictionary.UNSIGNED8: "uint8",
-    canopen.objectdictionary.UNSIGNED16: "uint16",
-    canopen.objectdictionary.UNSIGNED32: "uint32",
-    canopen.objectdictionary.UNSIGNED64: "uint64",
-    canopen.objectdictionary.VISIBLE_STRING: "string",
-    canopen.objectdictionary.REAL32: "float",
-    canopen.objectdictionary.REAL64: "double",
+    BOOLEAN: "bool",
+    INTEGER8: "int8",
+    INTEGER16: "int16",
+    INTEGER32: "int32",
+    INTEGER64: "int64",
+    UNSIGNED8: "uint8",
+    UNSIGNED16: "uint16",
+    UNSIGNED32: "uint32",
+    UNSIGNED64: "uint64",
+    VISIBLE_STRING: "string",
+    REAL32: "float",
+    REAL64: "double",
 }
 
-DT_LEN = {
-    canopen.objectdictionary.BOOLEAN: 8,
-    canopen.objectdictionary.INTEGER8: 8,
-    canopen.objectdictionary.INTEGER16: 16,
-    canopen.objectdictionary.INTEGER32: 32,
-    canopen.objectdictionary.INTEGER64: 64,
-    canopen.objectdictionary.UNSIGNED8: 8,
-    canopen.objectdictionary.UNSIGNED16: 16,
-    canopen.objectdictionary.UNSIGNED32: 32,
-    canopen.objectdictionary.UNSIGNED64: 64,
-    canopen.objectdictionary.VISIBLE_STRING: 0,
-    canopen.objectdictionary.REAL32: 32,
-    canopen.objectdictionary.REAL64: 64,
+_INT_DATA_ENCODING = {
+    INTEGER8: ("true", "twosComplement", "8"),
+    INTEGER16: ("true", "twosComplement", "16"),
+    INTEGER32: ("true", "twosComplement", "32"),
+    INTEGER64: ("true", "twosComplement", "64"),
+    UNSIGNED8: ("false", "unsigned", "8"),
+    UNSIGNED16: ("false", "unsigned", "16"),
+    UNSIGNED32: ("false", "unsigned", "32"),
+    UNSIGNED64: ("false", "unsigned", "64"),
 }
+"""XTCE signed flag, IntegerDataEncoding encoding and sizeInBits for each canopen integer type"""
+
+_DT_NAME_TRANS = str.maketrans({"/": "p", "%": "percent"})
+"""Replaces characters in units that are not valid in XTCE type names"""
 
 
-def make_obj_name(obj: canopen.objectdictionary.Variable) -> str:
+def make_obj_name(obj: Variable) -> str:
     """get obj name."""
 
     name = ""
     if obj.index < 0x5000:
         name += "c3_"
 
-    if isinstance(obj.parent, canopen.ObjectDictionary):
+    if isinstance(obj.parent, ObjectDictionary):
         name += obj.name
     else:
         name += f"{obj.parent.name}_{obj.name}"
@@ -91,22 +109,22 @@ def make_obj_name(obj: canopen.objectdictionary.Variable) -> str:
     return name
 
 
-def make_dt_name(obj: canopen.objectdictionary.Variable) -> str:
+def make_dt_name(obj: Variable) -> str:
     """Make xtce data type name."""
 
     type_name = CANOPEN_TO_XTCE_DT[obj.data_type]
     if obj.name in ["unix_time", "updater_status"]:
         type_name = obj.name
     elif obj.value_descriptions:
-        if isinstance(obj.parent, canopen.ObjectDictionary):
+        if isinstance(obj.parent, ObjectDictionary):
             type_name += f"_c3_{obj.name}"
         else:
             type_name += f"_{obj.parent.name}_{obj.name}"
-    elif obj.data_type == canopen.objectdictionary.VISIBLE_STRING:
+    elif obj.data_type == VISIBLE_STRING:
         type_name += f"{len(obj.default) * 8}"
     elif obj.unit:
         type_name += f"_{obj.unit}"
-    type_name = type_name.replace("/", "p").replace("%", "percent")
+    type_name = type_name.translate(_DT_NAME_TRANS)
 
     type_name += "_type"
 
@@ -154,8 +172,7 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
             "name": "uint32_type",
         },
     )
-    ET.SubElement(uint32_type, "UnitSet")
-    bin_data_enc = ET.SubElement(
+    ET.SubElement(
         uint32_type,
         "IntegerDataEncoding",
         attrib={
@@ -174,7 +191,6 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
             "shortDescription": "128 bitfield",
         },
     )
-    ET.SubElement(uint128_type, "UnitSet")
     bin_data_enc = ET.SubElement(
         uint128_type, "BinaryDataEncoding", attrib={"bitOrder": "leastSignificantBitFirst"}
     )
@@ -210,14 +226,64 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
     epoch = ET.SubElement(ref_time, "Epoch")
     epoch.text = "1970-01-01T00:00:00.000"
 
-    para_types = ["unix_time", "b128_type", "uint32_type"]
+    # the parameter types, parameters and beacon entries are all filled in one pass over the
+    # beacon, so make the ParameterSet and ContainerSet up front with their AX.25 header entries
+    para_set = ET.SubElement(tm_meta, "ParameterSet")
+
+    # hard-code the AX.25 headers as a Binary128 type
+    ET.SubElement(
+        para_set,
+        "Parameter",
+        attrib={
+            "name": "ax25_header",
+            "parameterTypeRef": "b128_type",
+            "shortDescription": "AX.25 Header",
+        },
+    )
+
+    cont_set = ET.SubElement(tm_meta, "ContainerSet")
+    seq_cont = ET.SubElement(
+        cont_set,
+        "SequenceContainer",
+        attrib={
+            "name": "Beacon",
+        },
+    )
+    entry_list = ET.SubElement(seq_cont, "EntryList")
+    ET.SubElement(
+        entry_list,
+        "ParameterRefEntry",
+        attrib={"parameterRef": "ax25_header"},
+    )
+
+    para_types = {"unix_time", "b128_type", "uint32_type"}
     for obj in config.beacon_def:
+        obj_name = make_obj_name(obj)
         name = make_dt_name(obj)
+        ET.SubElement(
+            para_set,
+            "Parameter",
+            attrib={
+                "name": obj_name,
+                "parameterTypeRef": name,
+                "shortDescription": obj.description,
+            },
+        )
+        ET.SubElement(
+            entry_list,
+            "ParameterRefEntry",
+            attrib={
+                "parameterRef": obj_name,
+            },
+        )
+
         if name in para_types:
             continue
-        para_types.append(name)
+        para_types.add(name)
+        data_type = obj.data_type
+        unit = obj.unit
 
-        if obj.data_type == canopen.objectdictionary.BOOLEAN:
+        if data_type == BOOLEAN:
             para_type = ET.SubElement(
                 tm_meta_para,
                 "BooleanParameterType",
@@ -227,7 +293,7 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
                     "oneStringValue": "1",
                 },
             )
-        elif obj.data_type in canopen.objectdictionary.UNSIGNED_TYPES and obj.value_descriptions:
+        elif data_type in UNSIGNED_TYPES and obj.value_descriptions:
             para_type = ET.SubElement(
                 tm_meta_para,
                 "EnumeratedParameterType",
@@ -236,42 +302,36 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
                 },
             )
             enum_list = ET.SubElement(para_type, "EnumerationList")
-            for value, name in obj.value_descriptions.items():
+            for value, label in obj.value_descriptions.items():
                 ET.SubElement(
                     enum_list,
                     "Enumeration",
                     attrib={
                         "value": str(value),
-                        "label": name,
+                        "label": label,
                     },
                 )
-        elif obj.data_type in canopen.objectdictionary.INTEGER_TYPES:
-            if obj.data_type in canopen.objectdictionary.UNSIGNED_TYPES:
-                signed = False
-                encoding = "unsigned"
-            else:
-                signed = True
-                encoding = "twosComplement"
-
+        elif data_type in _INT_DATA_ENCODING:
+            signed, encoding, size_bits = _INT_DATA_ENCODING[data_type]
             para_type = ET.SubElement(
                 tm_meta_para,
                 "IntegerParameterType",
                 attrib={
                     "name": name,
-                    "signed": str(signed).lower(),
+                    "signed": signed,
                 },
             )
 
-            para_unit_set = ET.SubElement(para_type, "UnitSet")
-            if obj.unit:
+            if unit:
+                para_unit_set = ET.SubElement(para_type, "UnitSet")
                 para_unit = ET.SubElement(
                     para_unit_set,
                     "Unit",
                     attrib={
-                        "description": obj.unit,
+                        "description": unit,
                     },
                 )
-                para_unit.text = obj.unit
+                para_unit.text = unit
 
             data_enc = ET.SubElement(
                 para_type,
@@ -279,7 +339,7 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
                 attrib={
                     "byteOrder": "leastSignificantByteFirst",
                     "encoding": encoding,
-                    "sizeInBits": str(DT_LEN[obj.data_type]),
+                    "sizeInBits": size_bits,
                 },
             )
             if obj.factor != 1:
@@ -293,7 +353,7 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
                         "coefficient": str(obj.factor),
                     },
                 )
-        elif obj.data_type == canopen.objectdictionary.VISIBLE_STRING:
+        elif data_type == VISIBLE_STRING:
             para_type = ET.SubElement(
                 tm_meta_para,
                 "StringParameterType",
@@ -313,28 +373,6 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
             fixed_value = ET.SubElement(fixed, "FixedValue")
             fixed_value.text = str(len(obj.default) * 8)
 
-    para_set = ET.SubElement(tm_meta, "ParameterSet")
-
-    # hard-code the AX.25 headers as a Binary128 type
-    ET.SubElement(
-        para_set,
-        "Parameter",
-        attrib={
-            "name": "ax25_header",
-            "parameterTypeRef": "b128_type",
-            "shortDescription": "AX.25 Header",
-        },
-    )
-    for obj in config.beacon_def:
-        ET.SubElement(
-            para_set,
-            "Parameter",
-            attrib={
-                "name": make_obj_name(obj),
-                "parameterTypeRef": make_dt_name(obj),
-                "shortDescription": obj.description,
-            },
-        )
     ET.SubElement(
         para_set,
         "Parameter",
@@ -344,29 +382,6 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
             "shortDescription": "crc check for beacon",
         },
     )
-
-    cont_set = ET.SubElement(tm_meta, "ContainerSet")
-    seq_cont = ET.SubElement(
-        cont_set,
-        "SequenceContainer",
-        attrib={
-            "name": "Beacon",
-        },
-    )
-    entry_list = ET.SubElement(seq_cont, "EntryList")
-    ET.SubElement(
-        entry_list,
-        "ParameterRefEntry",
-        attrib={"parameterRef": "ax25_header"},
-    )
-    for obj in config.beacon_def:
-        ET.SubElement(
-            entry_list,
-            "ParameterRefEntry",
-            attrib={
-                "parameterRef": make_obj_name(obj),
-            },
-        )
     ET.SubElement(
         entry_list,
         "ParameterRefEntry",
@@ -377,8 +392,9 @@ def write_xtce(config: OreSatConfig, dir_path: str = ".") -> None:
 
     tree = ET.ElementTree(root)
     ET.indent(tree, space="  ", level=0)
-    file_name = f"{config.mission.filename()}.xtce"
-    tree.write(f"{dir_path}/{file_name}", encoding="utf-8", xml_declaration=True)
+    file_path = os.path.join(dir_path, f"{config.mission.filename()}.xtce")
+    with open(file_path, "wb") as f:
+        tree.write(f, encoding="utf-8", xml_declaration=True)
 
 
 def gen_xtce(args: Optional[Namespace] = None) -> None:
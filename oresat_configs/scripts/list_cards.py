@@ -9,6 +9,7 @@ from tabulate import tabulate
 
 from ..card_info import Card, cards_from_csv
 from ..constants import Mission
+from . import DEFAULT_MISSION, MISSION_CHOICES, mission_arg
 
 LIST_CARDS = "list oresat cards, suitable as arguments to other commands"
 
@@ -22,9 +23,9 @@ def build_parser(parser: ArgumentParser) -> ArgumentParser:
     parser.formatter_class = RawDescriptionHelpFormatter
     parser.add_argument(
         "--oresat",
-        default=Mission.default().arg,
-        choices=[m.arg for m in Mission],
-        type=lambda x: x.lower().removeprefix("oresat"),
+        default=DEFAULT_MISSION,
+        choices=MISSION_CHOICES,
+        type=mission_arg,
         help="Oresat Mission. (Default: %(default)s)",
     )
     # I'd like to pull the descriptions directly out of Card but attribute docstrings are discarded
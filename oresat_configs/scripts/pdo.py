@@ -6,7 +6,8 @@ from typing import Any, Optional
 
 import canopen
 
-from .. import Mission, OreSatConfig
+from .. import OreSatConfig
+from . import DEFAULT_MISSION, MISSION_CHOICES, mission_arg
 
 PDO = "list or receive PDOs from the specified card"
 
@@ -19,9 +20,9 @@ def build_parser(parser: ArgumentParser) -> ArgumentParser:
     parser.description = PDO
     parser.add_argument(
         "--oresat",
-        default=Mission.default().arg,
-        choices=[m.arg for m in Mission],
-        type=lambda x: x.lower().removeprefix("oresat"),
+        default=DEFAULT_MISSION,
+        choices=MISSION_CHOICES,
+        type=mission_arg,
         help="Oresat Mission. (Default: %(default)s)",
     )
     parser.add_argument("card", help="card name")
@@ -5,11 +5,15 @@ from typing import Any, Optional
 
 import canopen
 
-from .. import Mission, OreSatConfig
+from .. import OreSatConfig
 from .._yaml_to_od import STR_2_OD_DATA_TYPE
+from . import DEFAULT_MISSION, MISSION_CHOICES, mission_arg
 
 PRINT_OD = "print the object dictionary out to stdout"
 
+OD_DATA_TYPE_2_STR = {value: key for key, value in STR_2_OD_DATA_TYPE.items()}
+"""Config data type name for each canopen data type"""
+
 
 def build_parser(parser: ArgumentParser) -> ArgumentParser:
     """Configures an ArgumentParser suitable for this script.
@@ -19,9 +23,9 @@ def build_parser(parser: ArgumentParser) -> ArgumentParser:
     parser.description = PRINT_OD
     parser.add_argument(
         "--oresat",
-        default=Mission.default().arg,
-        choices=[m.arg for m in Mission],
-        type=lambda x: x.lower().removeprefix("oresat"),
+        default=DEFAULT_MISSION,
+        choices=MISSION_CHOICES,
+        type=mission_arg,
         help="Oresat Mission. (Default: %(default)s)",
     )
     parser.add_argument("card", help="card name; c3, gps, star_tracker_1, etc")
@@ -58,21 +62,21 @@ def print_od(args: Optional[Namespace] = None) -> None:
 
     config = OreSatConfig(args.oresat)
 
-    inverted_od_data_types = {}
-    for key, value in STR_2_OD_DATA_TYPE.items():
-        inverted_od_data_types[value] = key
-
     arg_card = args.card.lower().replace("-", "_")
 
     od = config.od_db[arg_card]
-    for i in od:
-        if isinstance(od[i], canopen.objectdictionary.Variable):
-            data_type = inverted_od_data_types[od[i].data_type]
-            value = format_default(od[i].default)
-            print(f"0x{i:04X}: {od[i].name} - {data_type} - {value}")
+    lines = []
+    for i, obj in od.items():
+        if isinstance(obj, canopen.objectdictionary.Variable):
+            data_type = OD_DATA_TYPE_2_STR[obj.data_type]
+            value = format_default(obj.default)
+            lines.append(f"0x{i:04X}: {obj.name} - {data_type} - {value}")
         else:
-            print(f"0x{i:04X}: {od[i].name}")
-            for j in od[i]:
-                data_type = inverted_od_data_types[od[i][j].data_type]
-                value = format_default(od[i][j].default)
-                print(f"  0x{i:04X} 0x{j:02X}: {od[i][j].name} - {data_type} - {value}")
+            lines.append(f"0x{i:04X}: {obj.name}")
+            for j, sub_obj in obj.items():
+                data_type = OD_DATA_TYPE_2_STR[sub_obj.data_type]
+                value = format_default(sub_obj.default)
+                lines.append(f"  0x{i:04X} 0x{j:02X}: {sub_obj.name} - {data_type} - {value}")
+
+    if lines:
+        print("\n".join(lines))
@@ -12,7 +12,8 @@ from typing import Any, Optional, Union
 
 import canopen
 
-from .. import Mission, OreSatConfig
+from .. import OreSatConfig
+from . import DEFAULT_MISSION, MISSION_CHOICES, mission_arg
 
 SDO_TRANSFER = "read or write value to a node's object dictionary via SDO transfers"
 
@@ -38,9 +39,9 @@ def build_parser(parser: ArgumentParser) -> ArgumentParser:
     )
     parser.add_argument(
         "--oresat",
-        default=Mission.default().arg,
-        choices=[m.arg for m in Mission],
-        type=lambda x: x.lower().removeprefix("oresat"),
+        default=DEFAULT_MISSION,
+        choices=MISSION_CHOICES,
+        type=mission_arg,
         help="Oresat Mission. (Default: %(default)s)",
     )
     return parser
@@ -102,6 +102,17 @@ class TestConfig(unittest.TestCase):
                 if not isinstance(od[index], canopen.objectdictionary.Variable):
                     self.assertLessEqual(len(od[index].subindices), 255)
 
+    def test_generated_array_limits(self) -> None:
+        """Test that generated array subindexes get their limits from their value descriptions."""
+
+        node_status = self.config.od_db["c3"]["node_status"]
+        self.assertGreater(len(node_status), 1)
+        for subindex, obj in node_status.items():
+            if subindex == 0:
+                continue
+            self.assertEqual(obj.min, 0, f"{self.oresatid.name} node_status {obj.name} min")
+            self.assertEqual(obj.max, 0xFF, f"{self.oresatid.name} node_status {obj.name} max")
+
     def _test_snake_case(self, string: str) -> None:
         """Test that a string is snake_case."""
 
@@ -0,0 +1,46 @@
+"""Unit tests for the generated kaitai files."""
+
+import json
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from yaml import CSafeLoader, load
+
+from oresat_configs import Mission, OreSatConfig
+from oresat_configs.scripts.gen_kaitai import write_kaitai
+
+ODD_DESCRIPTIONS = [
+    "astral plane \U0001f600 \U00010348",
+    "non-ascii é ü ß µ°C",
+    "control chars \x7f \x85 \x9f \ufeff \x00",
+    "quotes ' \" and \\ backslash: # not a comment",
+    "yes",
+    "0x10",
+    "- leading dash",
+]
+"""Descriptions that are easy to get wrong when writing YAML scalars by hand."""
+
+
+class TestGenKaitai(unittest.TestCase):
+    """Test the generated kaitai files."""
+
+    def test_yaml_matches_json(self) -> None:
+        """The text built .ksy must parse to the same structure as the dict dumped as json."""
+
+        for mission in Mission:
+            config = OreSatConfig(mission)
+            for obj, description in zip(config.beacon_def[1:], ODD_DESCRIPTIONS):
+                obj.description = description
+
+            for include_docs in (True, False):
+                with self.subTest(mission=mission, include_docs=include_docs):
+                    with TemporaryDirectory() as dir_path:
+                        write_kaitai(config, dir_path, "yaml", include_docs)
+                        write_kaitai(config, dir_path, "json", include_docs)
+                        file_path = os.path.join(dir_path, f"{mission.filename()}.ksy")
+                        with open(file_path, encoding="utf-8") as f:
+                            kaitai_yaml = load(f, Loader=CSafeLoader)
+                        with open(f"{file_path}.json", encoding="utf-8") as f:
+                            kaitai_json = json.load(f)
+                    self.assertEqual(kaitai_yaml, kaitai_json)
@@ -0,0 +1,105 @@
+"""Unit tests for building ODs from the card configs."""
+
+import unittest
+
+from canopen import ObjectDictionary
+
+from oresat_configs import Mission, OreSatConfig
+from oresat_configs._yaml_to_od import (
+    TPDO_COMM_START,
+    _add_objects,
+    _add_tpdo_data,
+    _load_std_objs,
+    _make_obj,
+    overlay_configs,
+)
+from oresat_configs.card_config import CardConfig, GenerateSubindex, IndexObject, Rpdo, Tpdo
+
+
+class TestYamlToOd(unittest.TestCase):
+    """Test building ODs from the card configs."""
+
+    @staticmethod
+    def _gps_tpdo_od(config: CardConfig) -> ObjectDictionary:
+        """Build an OD with the GPS's objects and TPDOs."""
+
+        od = ObjectDictionary()
+        od.node_id = 0x10
+        od.device_information.product_name = "gps"
+        od.device_information.nr_of_TXPDO = 0
+        std_objs = _load_std_objs()
+        _add_objects(od, [std_objs[name] for name in config.std_objects], {})
+        _add_objects(od, config.objects, {})
+        _add_tpdo_data(od, config)
+        return od
+
+    def test_tpdo_config_reuse(self) -> None:
+        """Test that building TPDOs does not change the shared config.
+
+        The GPS time sync TPDO 16 uses the COB-ID of the C3's TPDO 1, that must not leak into the
+        config's TPDO num.
+        """
+
+        config = OreSatConfig(Mission.ORESAT0_5).configs["gps"]
+        nums = [tpdo.num for tpdo in config.tpdos]
+        self.assertIn(16, nums)
+
+        cob_ids = []
+        for _ in range(2):
+            od = self._gps_tpdo_od(config)
+            self.assertEqual([tpdo.num for tpdo in config.tpdos], nums)
+            cob_ids.append({num: od[TPDO_COMM_START + num - 1]["cob_id"].default for num in nums})
+
+        self.assertEqual(cob_ids[0], cob_ids[1])
+        self.assertEqual(cob_ids[0][16], 0x181)
+
+    def test_overlay_pdos(self) -> None:
+        """Test that an overlay PDO only replaces the card PDO with the same num."""
+
+        card_tpdos = [Tpdo(num=1, fields=[["a"]]), Tpdo(num=2, fields=[["b"]])]
+        card_rpdos = [Rpdo(num=1, card="c3", tpdo_num=1), Rpdo(num=2, card="c3", tpdo_num=2)]
+        card_config = CardConfig(tpdos=list(card_tpdos), rpdos=list(card_rpdos))
+        overlay_config = CardConfig(
+            tpdos=[Tpdo(num=2, fields=[["c"]], event_timer_ms=500), Tpdo(num=3, fields=[["d"]])],
+            rpdos=[Rpdo(num=2, card="gps", tpdo_num=16)],
+        )
+
+        overlay_configs(card_config, overlay_config)
+
+        self.assertEqual([tpdo.num for tpdo in card_config.tpdos], [1, 2, 3])
+        self.assertEqual(card_config.tpdos[0], card_tpdos[0])
+        self.assertEqual(card_config.tpdos[1].fields, [["c"]])
+        self.assertEqual(card_config.tpdos[1].event_timer_ms, 500)
+        self.assertEqual(card_config.tpdos[2].fields, [["d"]])
+
+        self.assertEqual([rpdo.num for rpdo in card_config.rpdos], [1, 2])
+        self.assertEqual(card_config.rpdos[0], card_rpdos[0])
+        self.assertEqual(card_config.rpdos[1], Rpdo(num=2, card="gps", tpdo_num=16))
+
+        # the card's PDOs are shared with the cached configs and must not be changed in place
+        self.assertEqual(card_tpdos[1].fields, [["b"]])
+        self.assertEqual(card_rpdos[1].card, "c3")
+
+    def test_node_id_defaults(self) -> None:
+        """Test that the node id is stripped from integer defaults."""
+
+        defaults = {
+            "0x180+$NODE_ID": 0x180,
+            "$NODE_ID+0x200": 0x200,
+            "384+$NODE_ID": 384,
+            "$NODE_ID+512": 512,
+            "0x10": 0x10,
+        }
+        for default, value in defaults.items():
+            with self.subTest(default=default):
+                obj = IndexObject(name="var", index=0x4000, data_type="uint32", default=default)
+                self.assertEqual(_make_obj(obj, {}).default, value)
+
+                gen_sub = GenerateSubindex(
+                    name="sub", subindexes="fixed_length", length=2, default=default
+                )
+                obj = IndexObject(
+                    name="arr", index=0x4001, object_type="array", generate_subindexes=gen_sub
+                )
+                arr = _make_obj(obj, {})
+                self.assertEqual([arr[1].default, arr[2].default], [value, value])